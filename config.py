@@ -5,11 +5,16 @@ Zero-configuration defaults for production-grade drift detection
 
 # Database Configuration
 DATABASE_PATH = "driftwatch.db"
+DATABASE_READER_POOL_SIZE = 4  # Read-only connections serving queries alongside the writer
+DATABASE_CACHE_TTL_SECONDS = 1.0  # In-process cache lifetime for baseline/health rows
+HEALTH_STATE_CACHE_SIZE = 10000   # Services whose current state is kept in memory (LRU)
 
 # Baseline Generation Parameters
 MIN_SAMPLES_FOR_BASELINE = 100  # Minimum samples before transitioning to STABLE
 BASELINE_WINDOW_SIZE = 1000     # Maximum samples to consider for baseline
 BASELINE_RECALC_INTERVAL = 50   # Recalculate baseline after N new samples
+BASELINE_WINDOW_CACHE_SIZE = 1000  # Services whose baseline window is kept in memory (LRU)
+BASELINE_SCALE_CACHE_SECONDS = 60.0  # Drift scoring re-reads a service's baseline at least this often
 
 # Drift Detection Parameters
 DRIFT_ZSCORE_THRESHOLD = 3.0           # Z-score threshold for single anomaly
@@ -17,17 +22,29 @@ DRIFT_CONSECUTIVE_THRESHOLD = 5        # Consecutive anomalies to trigger DRIFT_
 DRIFT_MODERATE_ZSCORE_THRESHOLD = 2.5  # Moderate anomaly threshold
 DRIFT_MODERATE_COUNT = 10              # Moderate anomalies in window
 DRIFT_MODERATE_WINDOW = 20             # Window size for moderate anomaly detection
+DRIFT_ADWIN_ENABLED = False            # Also flag drift when ADWIN finds a shift in the z-score stream
+DRIFT_ADWIN_DELTA = 0.002              # ADWIN confidence parameter (lower = fewer false alarms)
+DRIFT_ADWIN_MAX_WINDOW = 10000         # Samples an ADWIN window may span (bounds its bucket count)
+DRIFT_STATE_CACHE_SIZE = 10000         # Services whose drift detector state is kept in memory (LRU)
 
 # Recovery Parameters
 RECOVERY_CONSECUTIVE_NORMAL = 50  # Consecutive normal samples to recover from drift
 
+# Ingestion Parameters
+INGESTION_BATCH_MAX = 100  # Maximum telemetry items persisted per transaction
+
 # Data Retention
 TELEMETRY_RETENTION_DAYS = 7
 DRIFT_EVENTS_RETENTION_DAYS = 30
+CLEANUP_DELETE_BATCH_SIZE = 5000  # Rows deleted per table per retention transaction
+ENABLE_INCREMENTAL_VACUUM = True  # Create new databases with auto_vacuum=INCREMENTAL
+INCREMENTAL_VACUUM_PAGES = 1000   # Free pages reclaimed after each retention sweep
 
 # API Configuration
 API_HOST = "0.0.0.0"
 API_PORT = 8000
+TELEMETRY_BATCH_MAX_ITEMS = 500  # Maximum samples accepted by one batch ingestion request
+SYSTEM_STATUS_CACHE_SECONDS = 5.0  # Reuse database counts/size in /v1/system/status for this long
 
 # Validation Parameters
 MAX_SERVICE_ID_LENGTH = 64
@@ -4,44 +4,458 @@ SQLite connection management and schema initialization
 """
 import aiosqlite
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+import orjson
+import time
+import numpy as np
+from collections import Counter
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple, Callable, Awaitable, AsyncIterator
+from logging_queue import get_logger
 from config import (
     DATABASE_PATH, 
+    DATABASE_READER_POOL_SIZE,
+    DATABASE_CACHE_TTL_SECONDS,
     TELEMETRY_RETENTION_DAYS,
-    DRIFT_EVENTS_RETENTION_DAYS
+    DRIFT_EVENTS_RETENTION_DAYS,
+    CLEANUP_DELETE_BATCH_SIZE,
+    ENABLE_INCREMENTAL_VACUUM,
+    INCREMENTAL_VACUUM_PAGES
 )
 
 
+log = get_logger("driftwatch.database")
+
+
+# Connection tuning: WAL journal with relaxed fsync, in-memory temp storage,
+# 64MB page cache and 256MB memory-mapped I/O
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=memory",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=268435456",
+)
+
+# Prepared statements are cached per connection keyed by SQL text, so hot
+# statements live in module constants to keep the cache key identical
+STATEMENT_CACHE_SIZE = 256
+
+_SQL_INSERT_TELEMETRY = """
+    INSERT INTO telemetry (service_id, timestamp, latency_ms, payload_kb, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ZSCORE = """
+    INSERT INTO zscore_history 
+    (service_id, timestamp, latency_zscore, payload_zscore, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_DRIFT = """
+    INSERT INTO drift_events 
+    (service_id, detected_at, previous_state, new_state, trigger_samples, metadata)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_HEALTH = """
+    INSERT INTO health_states 
+    (service_id, state, transition_timestamp, metadata)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(service_id) DO UPDATE SET
+        state = excluded.state,
+        transition_timestamp = excluded.transition_timestamp,
+        metadata = excluded.metadata
+"""
+
+_SQL_UPSERT_BASELINE = """
+    INSERT INTO baselines 
+    (service_id, sample_count, mean_latency, stddev_latency, 
+     mean_payload, stddev_payload, p50_latency, p95_latency, p99_latency,
+     n, last_updated, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(service_id) DO UPDATE SET
+        sample_count = excluded.sample_count,
+        mean_latency = excluded.mean_latency,
+        stddev_latency = excluded.stddev_latency,
+        mean_payload = excluded.mean_payload,
+        stddev_payload = excluded.stddev_payload,
+        p50_latency = excluded.p50_latency,
+        p95_latency = excluded.p95_latency,
+        p99_latency = excluded.p99_latency,
+        n = excluded.n,
+        last_updated = excluded.last_updated
+"""
+
+_SQL_ADVANCE_BASELINE_COUNT = """
+    UPDATE baselines
+    SET n = n + ?
+    WHERE service_id = ?
+    RETURNING n
+"""
+
+_SQL_ADVANCE_SERVICE_COUNTER = """
+    INSERT INTO service_counters (service_id, telemetry_count)
+    VALUES (?, ?)
+    ON CONFLICT(service_id) DO UPDATE SET
+        telemetry_count = telemetry_count + excluded.telemetry_count
+    RETURNING telemetry_count
+"""
+
+_SQL_RETIRE_SERVICE_COUNTER = """
+    UPDATE service_counters
+    SET telemetry_count = telemetry_count - ?
+    WHERE service_id = ?
+"""
+
+# Columns added after the first release: (name, definition, backfill expression)
+_SCHEMA_ADDED_COLUMNS = {
+    'baselines': (
+        ('n', 'INTEGER NOT NULL DEFAULT 0', 'sample_count'),
+    ),
+}
+
+# A write operation runs against the connection inside the group-commit transaction
+WriteOperation = Callable[[aiosqlite.Connection], Awaitable[Any]]
+
+_MS_PER_DAY = 86_400_000
+
+
+def _now_ms() -> int:
+    """Current wall-clock time as Unix epoch milliseconds"""
+    return time.time_ns() // 1_000_000
+
+
+@lru_cache(maxsize=4096)
+def ms_to_datetime(ms: int) -> datetime:
+    """
+    Convert stored epoch milliseconds to a local datetime
+    
+    Stored timestamps (baseline updates, state transitions) are read far
+    more often than they change, so conversions are memoized.
+    """
+    return datetime.fromtimestamp(ms / 1000)
+
+
+# Largest batch written as one multi-row INSERT (5 bound parameters per row)
+_BULK_INSERT_MAX_ROWS = 100
+
+
+@lru_cache(maxsize=_BULK_INSERT_MAX_ROWS)
+def _bulk_insert_sql(n: int) -> str:
+    """Multi-row telemetry INSERT for exactly n rows"""
+    return (
+        "INSERT INTO telemetry (service_id, timestamp, latency_ms, payload_kb, created_at) VALUES "
+        + ", ".join(["(?, ?, ?, ?, ?)"] * n)
+    )
+
+
+class _ReadCache:
+    """
+    Short-lived per-service cache for rows that change rarely
+    
+    Reads that raced with an invalidation are not stored, so a write is
+    never masked by a value fetched before it committed.
+    """
+    
+    MISS = object()
+    
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+    
+    def get(self, key: str) -> Any:
+        """Return the cached value or MISS"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return self.MISS
+        return entry[1]
+    
+    def put(self, key: str, value: Any, version: int):
+        """Store a value read while the cache was at `version`"""
+        if version == self.version:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+    
+    def update(self, key: str, changes: Dict[str, Any]):
+        """Apply a write's new column values to a cached row and reject in-flight reads"""
+        self.version += 1
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] is not None:
+            self._entries[key] = (entry[0], {**entry[1], **changes})
+    
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one key (or everything) and reject in-flight reads"""
+        self.version += 1
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
 class Database:
     """Async SQLite database manager"""
     
     def __init__(self, db_path: str = DATABASE_PATH):
         self.db_path = db_path
         self._connection: Optional[aiosqlite.Connection] = None
-        self._lock = asyncio.Lock()
+        self._incremental_vacuum = False
+        
+        # Group commit: writers queue operations, a single task commits them
+        self._pending: List[Tuple[WriteOperation, asyncio.Future]] = []
+        self._pending_event = asyncio.Event()
+        self._commit_task: Optional[asyncio.Task] = None
+        self._closing = False
+        
+        # Read-only connections: WAL lets readers run alongside the writer
+        self._readers: List[aiosqlite.Connection] = []
+        self._reader_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Hot-path read caches, invalidated by the corresponding writes
+        self._count_cache: Dict[str, int] = {}
+        self._count_version = 0
+        self._baseline_cache = _ReadCache(DATABASE_CACHE_TTL_SECONDS)
+        self._health_cache = _ReadCache(DATABASE_CACHE_TTL_SECONDS)
     
     async def connect(self):
         """Initialize database connection and schema"""
-        self._connection = await aiosqlite.connect(self.db_path)
+        # Autocommit mode: transactions are managed explicitly by the committer
+        self._connection = await aiosqlite.connect(
+            self.db_path,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE
+        )
         self._connection.row_factory = aiosqlite.Row
+        await self._configure_auto_vacuum()
+        await self._apply_pragmas(self._connection)
         await self._init_schema()
+        await self._open_readers()
+        self._closing = False
+        self._commit_task = asyncio.create_task(self._commit_loop())
         print(f"✓ Database connected: {self.db_path}")
     
+    async def _configure_auto_vacuum(self):
+        """
+        Enable incremental auto-vacuum on a freshly created database
+        
+        auto_vacuum can only be changed before the first table is created,
+        so existing databases keep whatever mode they were built with.
+        """
+        cursor = await self._connection.execute("PRAGMA auto_vacuum")
+        mode = (await cursor.fetchone())[0]
+        
+        if ENABLE_INCREMENTAL_VACUUM and mode == 0:
+            cursor = await self._connection.execute("SELECT COUNT(*) FROM sqlite_master")
+            if (await cursor.fetchone())[0] == 0:
+                await self._connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                mode = 2
+        
+        self._incremental_vacuum = ENABLE_INCREMENTAL_VACUUM and mode == 2
+    
+    async def _apply_pragmas(self, connection: aiosqlite.Connection, read_only: bool = False):
+        """Apply performance pragmas to a connection"""
+        for pragma in CONNECTION_PRAGMAS:
+            if read_only and pragma.startswith("PRAGMA journal_mode"):
+                continue  # Journal mode is a property of the file, set by the writer
+            await connection.execute(pragma)
+    
+    async def _open_readers(self):
+        """
+        Open the pool of read-only connections
+        
+        An in-memory database is private to its connection, so reads there
+        go through the writer connection instead.
+        """
+        if self.db_path == ":memory:":
+            return
+        
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        for _ in range(DATABASE_READER_POOL_SIZE):
+            reader = await aiosqlite.connect(
+                uri,
+                uri=True,
+                cached_statements=STATEMENT_CACHE_SIZE
+            )
+            reader.row_factory = aiosqlite.Row
+            await self._apply_pragmas(reader, read_only=True)
+            self._readers.append(reader)
+        self._reader_semaphore = asyncio.Semaphore(len(self._readers))
+    
+    @asynccontextmanager
+    async def _acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool"""
+        if self._reader_semaphore is None:
+            yield self._connection
+            return
+        
+        async with self._reader_semaphore:
+            reader = self._readers.pop()
+            try:
+                yield reader
+            finally:
+                self._readers.append(reader)
+    
     async def _init_schema(self):
         """Create tables if they don't exist"""
         with open('schema.sql', 'r') as f:
             schema = f.read()
         
         await self._connection.executescript(schema)
+        
+        for table, columns in _SCHEMA_ADDED_COLUMNS.items():
+            cursor = await self._connection.execute(f"PRAGMA table_info({table})")
+            existing = {row['name'] for row in await cursor.fetchall()}
+            for name, definition, backfill in columns:
+                if name in existing:
+                    continue
+                await self._connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {name} {definition}"
+                )
+                if backfill:
+                    await self._connection.execute(
+                        f"UPDATE {table} SET {name} = {backfill}"
+                    )
+        
+        # Seed counters for databases that predate service_counters
+        cursor = await self._connection.execute("SELECT 1 FROM service_counters LIMIT 1")
+        if await cursor.fetchone() is None:
+            await self._connection.execute(
+                """
+                INSERT INTO service_counters (service_id, telemetry_count)
+                SELECT service_id, COUNT(*) FROM telemetry GROUP BY service_id
+                """
+            )
+        
         await self._connection.commit()
     
     async def close(self):
         """Close database connection"""
+        if self._commit_task:
+            # Let the committer drain outstanding writes before closing
+            self._closing = True
+            self._pending_event.set()
+            await self._commit_task
+            self._commit_task = None
+        
+        while self._readers:
+            await self._readers.pop().close()
+        self._reader_semaphore = None
+        
         if self._connection:
+            # Refresh planner statistics so the per-service indexes stay preferred
+            await self._connection.execute("PRAGMA optimize")
             await self._connection.close()
             print("✓ Database connection closed")
     
+    # Group Commit
+    
+    async def _execute_write(self, operation: WriteOperation) -> Any:
+        """
+        Queue a write operation and wait until its transaction commits
+        
+        Args:
+            operation: Async callable receiving the connection
+        
+        Returns:
+            Whatever the operation returned (typically a cursor)
+        """
+        if self._commit_task is None or self._commit_task.done():
+            raise RuntimeError("Database writer is not running")
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((operation, future))
+        self._pending_event.set()
+        return await future
+    
+    async def _write(self, sql: str, params: Tuple = ()) -> aiosqlite.Cursor:
+        """Queue a single statement for group commit"""
+        return await self._execute_write(lambda conn: conn.execute(sql, params))
+    
+    async def _commit_loop(self):
+        """
+        Single writer loop
+        
+        Every wakeup commits all writes queued so far in one transaction;
+        writes arriving while a commit is in flight form the next group.
+        """
+        try:
+            while not (self._closing and not self._pending):
+                await self._pending_event.wait()
+                await asyncio.sleep(0)  # Let writers scheduled in the same tick join
+                self._pending_event.clear()
+                
+                batch, self._pending = self._pending, []
+                if batch:
+                    await self._commit_batch(batch)
+        finally:
+            # However the loop ends, no queued writer is left waiting
+            batch, self._pending = self._pending, []
+            self._fail_writes(batch, RuntimeError("Database writer stopped"))
+    
+    async def _commit_batch(self, batch: List[Tuple[WriteOperation, asyncio.Future]]):
+        """
+        Run a group of write operations inside one transaction
+        
+        Each operation runs in its own savepoint, so one that fails has all
+        of its statements undone while the rest of the group still commits.
+        """
+        results = []
+        connection = self._connection
+        try:
+            await connection.execute("BEGIN IMMEDIATE")
+            for operation, future in batch:
+                await connection.execute("SAVEPOINT op")
+                try:
+                    result = await operation(connection)
+                except Exception as e:
+                    await connection.execute("ROLLBACK TO op")
+                    await connection.execute("RELEASE op")
+                    self._drop_counter_caches()
+                    results.append((future, None, e))
+                else:
+                    await connection.execute("RELEASE op")
+                    results.append((future, result, None))
+            await connection.commit()
+        except BaseException as e:
+            # Also reached on cancellation, so callers are always answered
+            log.error(f"✗ Group commit of {len(batch)} writes failed: {e!r}")
+            try:
+                if connection.in_transaction:
+                    await connection.rollback()
+            except Exception as rollback_error:
+                log.error(f"✗ Rollback of failed group commit failed: {rollback_error}")
+            self._drop_counter_caches()
+            
+            if not isinstance(e, Exception):
+                self._fail_writes(batch, RuntimeError("Group commit interrupted"))
+                raise
+            self._fail_writes(batch, e)
+            return
+        
+        for future, result, error in results:
+            if future.done():
+                continue  # Caller went away
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+    
+    @staticmethod
+    def _fail_writes(batch: List[Tuple[WriteOperation, asyncio.Future]], error: Exception):
+        """Answer every still-waiting writer in a group with an error"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    def _drop_counter_caches(self):
+        """Forget counters published by writes that were rolled back"""
+        self._count_cache.clear()
+        self._count_version += 1
+        self._baseline_cache.invalidate()
+    
     # Telemetry Operations
     
     async def insert_telemetry(
@@ -53,52 +467,199 @@ class Database:
     ) -> int:
         """Insert telemetry record"""
         ts_epoch = int(timestamp.timestamp() * 1000)
-        created_at = int(datetime.now().timestamp() * 1000)
-        
-        cursor = await self._connection.execute(
-            """
-            INSERT INTO telemetry (service_id, timestamp, latency_ms, payload_kb, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (service_id, ts_epoch, latency_ms, payload_kb, created_at)
-        )
-        await self._connection.commit()
+        created_at = _now_ms()
+        
+        async def insert(conn: aiosqlite.Connection):
+            cursor = await conn.execute(
+                _SQL_INSERT_TELEMETRY,
+                (service_id, ts_epoch, latency_ms, payload_kb, created_at)
+            )
+            await self._advance_counters(conn, {service_id: 1})
+            return cursor
+        
+        cursor = await self._execute_write(insert)
         return cursor.lastrowid
     
+    async def insert_telemetry_batch(
+        self,
+        records: List[Tuple[str, datetime, float, float]]
+    ) -> int:
+        """
+        Insert many telemetry records in a single transaction
+        
+        Args:
+            records: (service_id, timestamp, latency_ms, payload_kb) tuples
+        
+        Returns:
+            Number of records inserted
+        """
+        if not records:
+            return 0
+        
+        created_at = _now_ms()
+        rows = [
+            (service_id, int(timestamp.timestamp() * 1000), latency_ms, payload_kb, created_at)
+            for service_id, timestamp, latency_ms, payload_kb in records
+        ]
+        
+        # Rows per service in this batch (advances the per-service counters)
+        groups = Counter(service_id for service_id, *_ in records)
+        
+        async def insert(conn: aiosqlite.Connection):
+            if len(rows) <= _BULK_INSERT_MAX_ROWS:
+                # One statement for the whole batch: a single VDBE program run
+                await conn.execute(
+                    _bulk_insert_sql(len(rows)),
+                    [value for row in rows for value in row]
+                )
+            else:
+                await conn.executemany(_SQL_INSERT_TELEMETRY, rows)
+            await self._advance_counters(conn, groups)
+        
+        await self._execute_write(insert)
+        return len(rows)
+    
+    async def _advance_counters(self, conn: aiosqlite.Connection, inserted: Dict[str, int]):
+        """
+        Advance per-service counters and publish them to the read caches
+        
+        Runs inside the write transaction, before the commit: the counters'
+        new values come back via RETURNING and replace the cached ones
+        outright, and the version bump rejects reads already in flight, so
+        a read racing the commit can't cache a value that is then counted
+        again. Rolled-back writes clear both caches.
+        """
+        self._count_version += 1
+        for service_id, count in inserted.items():
+            cursor = await conn.execute(_SQL_ADVANCE_SERVICE_COUNTER, (service_id, count))
+            self._count_cache[service_id] = (await cursor.fetchone())[0]
+            
+            cursor = await conn.execute(_SQL_ADVANCE_BASELINE_COUNT, (count, service_id))
+            row = await cursor.fetchone()
+            if row is not None:
+                self._baseline_cache.update(service_id, {'n': row[0]})
+    
     async def get_recent_telemetry(
         self, 
         service_id: str, 
         limit: int = 1000
     ) -> List[Dict[str, Any]]:
         """Get recent telemetry for a service"""
-        cursor = await self._connection.execute(
-            """
-            SELECT * FROM telemetry
-            WHERE service_id = ?
-            ORDER BY timestamp DESC
-            LIMIT ?
-            """,
-            (service_id, limit)
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                """
+                SELECT * FROM telemetry
+                WHERE service_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+                """,
+                (service_id, limit)
+            )
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
+    
+    async def get_recent_metrics(
+        self,
+        service_id: str,
+        limit: int = 1000
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get recent latency and payload values for a service as arrays
+        
+        Narrow alternative to get_recent_telemetry for numeric consumers:
+        only the two metric columns are read and no per-row dicts are built.
+        
+        Returns:
+            Tuple of (latencies, payloads), newest first
+        """
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                """
+                SELECT latency_ms, payload_kb FROM telemetry
+                WHERE service_id = ?
+                ORDER BY timestamp DESC
+                LIMIT ?
+                """,
+                (service_id, limit)
+            )
+            rows = await cursor.fetchall()
+        
+        latencies = np.fromiter((row[0] for row in rows), dtype=np.float64, count=len(rows))
+        payloads = np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+        return latencies, payloads
+    
+    async def get_recent_metrics_many(
+        self,
+        service_ids: List[str],
+        limit: int = 1000
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get recent latency and payload arrays for several services in one query
+        
+        Returns:
+            Mapping of service_id to (latencies, payloads), newest first;
+            services without telemetry are omitted
+        """
+        if not service_ids:
+            return {}
+        
+        placeholders = ", ".join("?" * len(service_ids))
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                f"""
+                SELECT service_id, latency_ms, payload_kb FROM (
+                    SELECT service_id, latency_ms, payload_kb,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY service_id ORDER BY timestamp DESC
+                           ) AS position
+                    FROM telemetry
+                    WHERE service_id IN ({placeholders})
+                )
+                WHERE position <= ?
+                ORDER BY service_id, position
+                """,
+                (*service_ids, limit)
+            )
+            rows = await cursor.fetchall()
+        
+        # Rows arrive grouped by service; split the metric columns at each change
+        metrics = np.array([(row[1], row[2]) for row in rows], dtype=np.float64).reshape(-1, 2)
+        starts = [0] + [i for i in range(1, len(rows)) if rows[i][0] != rows[i - 1][0]]
+        ends = starts[1:] + [len(rows)]
+        return {
+            rows[start][0]: (metrics[start:end, 0], metrics[start:end, 1])
+            for start, end in zip(starts, ends)
+            if start < end
+        }
     
     async def get_telemetry_count(self, service_id: str) -> int:
         """Count telemetry records for a service"""
-        cursor = await self._connection.execute(
-            "SELECT COUNT(*) as count FROM telemetry WHERE service_id = ?",
-            (service_id,)
-        )
-        row = await cursor.fetchone()
-        return row['count']
+        cached = self._count_cache.get(service_id)
+        if cached is not None:
+            return cached
+        
+        version = self._count_version
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                "SELECT telemetry_count FROM service_counters WHERE service_id = ?",
+                (service_id,)
+            )
+            row = await cursor.fetchone()
+        
+        count = row['telemetry_count'] if row else 0
+        # Only seed the cache if no insert landed while we were reading
+        if version == self._count_version:
+            self._count_cache[service_id] = count
+        return count
     
     async def get_total_telemetry_count(self) -> int:
         """Count all telemetry records"""
-        cursor = await self._connection.execute(
-            "SELECT COUNT(*) as count FROM telemetry"
-        )
-        row = await cursor.fetchone()
-        return row['count']
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                "SELECT COALESCE(SUM(telemetry_count), 0) as count FROM service_counters"
+            )
+            row = await cursor.fetchone()
+            return row['count']
     
     # Baseline Operations
     
@@ -114,54 +675,83 @@ class Database:
         p95_latency: Optional[float] = None,
         p99_latency: Optional[float] = None
     ):
-        """Insert or update baseline statistics"""
-        now = int(datetime.now().timestamp() * 1000)
+        """
+        Insert or update baseline statistics
         
-        async with self._lock:
-            cursor = await self._connection.execute(
-                "SELECT service_id FROM baselines WHERE service_id = ?",
-                (service_id,)
+        The running count n restarts at sample_count and is advanced by
+        every subsequent insert.
+        """
+        await self._write(
+            _SQL_UPSERT_BASELINE,
+            self._baseline_row(
+                service_id, sample_count, mean_latency, stddev_latency,
+                mean_payload, stddev_payload, p50_latency, p95_latency, p99_latency,
+                _now_ms()
             )
-            exists = await cursor.fetchone()
-            
-            if exists:
-                await self._connection.execute(
-                    """
-                    UPDATE baselines 
-                    SET sample_count = ?, mean_latency = ?, stddev_latency = ?,
-                        mean_payload = ?, stddev_payload = ?, 
-                        p50_latency = ?, p95_latency = ?, p99_latency = ?,
-                        last_updated = ?
-                    WHERE service_id = ?
-                    """,
-                    (sample_count, mean_latency, stddev_latency, 
-                     mean_payload, stddev_payload,
-                     p50_latency, p95_latency, p99_latency, now, service_id)
-                )
-            else:
-                await self._connection.execute(
-                    """
-                    INSERT INTO baselines 
-                    (service_id, sample_count, mean_latency, stddev_latency, 
-                     mean_payload, stddev_payload, p50_latency, p95_latency, p99_latency,
-                     last_updated, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (service_id, sample_count, mean_latency, stddev_latency,
-                     mean_payload, stddev_payload, p50_latency, p95_latency, p99_latency,
-                     now, now)
-                )
-            
-            await self._connection.commit()
+        )
+        self._baseline_cache.invalidate(service_id)
+    
+    async def upsert_baselines(self, baselines: List[Dict[str, Any]]):
+        """
+        Insert or update many baselines in one statement batch
+        
+        Args:
+            baselines: Dicts with the keyword arguments of upsert_baseline
+        """
+        if not baselines:
+            return
+        
+        now = _now_ms()
+        rows = [
+            self._baseline_row(
+                b['service_id'], b['sample_count'], b['mean_latency'], b['stddev_latency'],
+                b['mean_payload'], b['stddev_payload'],
+                b.get('p50_latency'), b.get('p95_latency'), b.get('p99_latency'),
+                now
+            )
+            for b in baselines
+        ]
+        await self._execute_write(lambda conn: conn.executemany(_SQL_UPSERT_BASELINE, rows))
+        for b in baselines:
+            self._baseline_cache.invalidate(b['service_id'])
+    
+    @staticmethod
+    def _baseline_row(
+        service_id: str,
+        sample_count: int,
+        mean_latency: float,
+        stddev_latency: float,
+        mean_payload: float,
+        stddev_payload: float,
+        p50_latency: Optional[float],
+        p95_latency: Optional[float],
+        p99_latency: Optional[float],
+        now: int
+    ) -> Tuple:
+        """Parameters for _SQL_UPSERT_BASELINE"""
+        return (
+            service_id, sample_count, mean_latency, stddev_latency,
+            mean_payload, stddev_payload, p50_latency, p95_latency, p99_latency,
+            sample_count, now, now
+        )
     
     async def get_baseline(self, service_id: str) -> Optional[Dict[str, Any]]:
         """Get baseline for a service"""
-        cursor = await self._connection.execute(
-            "SELECT * FROM baselines WHERE service_id = ?",
-            (service_id,)
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+        cached = self._baseline_cache.get(service_id)
+        if cached is not _ReadCache.MISS:
+            return cached
+        
+        version = self._baseline_cache.version
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                "SELECT * FROM baselines WHERE service_id = ?",
+                (service_id,)
+            )
+            row = await cursor.fetchone()
+        
+        baseline = dict(row) if row else None
+        self._baseline_cache.put(service_id, baseline, version)
+        return baseline
     
     # Health State Operations
     
@@ -172,54 +762,63 @@ class Database:
         metadata: Optional[Dict[str, Any]] = None
     ):
         """Insert or update health state"""
-        import json
-        now = int(datetime.now().timestamp() * 1000)
-        metadata_json = json.dumps(metadata) if metadata else None
+        now = _now_ms()
+        metadata_json = orjson.dumps(metadata, option=orjson.OPT_SERIALIZE_NUMPY) if metadata else None
         
-        async with self._lock:
-            cursor = await self._connection.execute(
-                "SELECT service_id FROM health_states WHERE service_id = ?",
-                (service_id,)
-            )
-            exists = await cursor.fetchone()
-            
-            if exists:
-                await self._connection.execute(
-                    """
-                    UPDATE health_states 
-                    SET state = ?, transition_timestamp = ?, metadata = ?
-                    WHERE service_id = ?
-                    """,
-                    (state, now, metadata_json, service_id)
-                )
-            else:
-                await self._connection.execute(
-                    """
-                    INSERT INTO health_states 
-                    (service_id, state, transition_timestamp, metadata)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (service_id, state, now, metadata_json)
-                )
-            
-            await self._connection.commit()
+        await self._write(
+            _SQL_INSERT_HEALTH,
+            (service_id, state, now, metadata_json)
+        )
+        self._health_cache.invalidate(service_id)
     
     async def get_health_state(self, service_id: str) -> Optional[Dict[str, Any]]:
         """Get health state for a service"""
-        cursor = await self._connection.execute(
-            "SELECT * FROM health_states WHERE service_id = ?",
-            (service_id,)
-        )
-        row = await cursor.fetchone()
-        return dict(row) if row else None
+        cached = self._health_cache.get(service_id)
+        if cached is not _ReadCache.MISS:
+            return cached
+        
+        version = self._health_cache.version
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                "SELECT * FROM health_states WHERE service_id = ?",
+                (service_id,)
+            )
+            row = await cursor.fetchone()
+        
+        health = dict(row) if row else None
+        self._health_cache.put(service_id, health, version)
+        return health
     
     async def get_monitored_services_count(self) -> int:
         """Count services with health states"""
-        cursor = await self._connection.execute(
-            "SELECT COUNT(DISTINCT service_id) as count FROM health_states"
-        )
-        row = await cursor.fetchone()
-        return row['count']
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                "SELECT COUNT(DISTINCT service_id) as count FROM health_states"
+            )
+            row = await cursor.fetchone()
+            return row['count']
+    
+    async def get_telemetry_totals(self) -> Tuple[int, int]:
+        """
+        Services holding telemetry and total telemetry records
+        
+        Read from service_counters, which inserts and retention deletes keep
+        in step with the telemetry table, so this is one row per service
+        rather than a scan of telemetry.
+        
+        Returns:
+            Tuple of (services, records)
+        """
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                """
+                SELECT COUNT(*), COALESCE(SUM(telemetry_count), 0)
+                FROM service_counters
+                WHERE telemetry_count > 0
+                """
+            )
+            row = await cursor.fetchone()
+            return row[0], row[1]
     
     # Drift Event Operations
     
@@ -231,21 +830,23 @@ class Database:
         trigger_samples: Optional[List[float]] = None,
         metadata: Optional[Dict[str, Any]] = None
     ) -> int:
-        """Insert drift event for audit trail"""
-        import json
-        now = int(datetime.now().timestamp() * 1000)
-        trigger_json = json.dumps(trigger_samples) if trigger_samples else None
-        metadata_json = json.dumps(metadata) if metadata else None
-        
-        cursor = await self._connection.execute(
-            """
-            INSERT INTO drift_events 
-            (service_id, detected_at, previous_state, new_state, trigger_samples, metadata)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+        """
+        Insert drift event for audit trail
+        
+        trigger_samples and metadata are stored as UTF-8 JSON bytes;
+        NumPy arrays and scalars are serialized without conversion.
+        """
+        now = _now_ms()
+        trigger_json = (
+            orjson.dumps(trigger_samples, option=orjson.OPT_SERIALIZE_NUMPY)
+            if trigger_samples is not None and len(trigger_samples) else None
+        )
+        metadata_json = orjson.dumps(metadata, option=orjson.OPT_SERIALIZE_NUMPY) if metadata else None
+        
+        cursor = await self._write(
+            _SQL_INSERT_DRIFT,
             (service_id, now, previous_state, new_state, trigger_json, metadata_json)
         )
-        await self._connection.commit()
         return cursor.lastrowid
     
     async def get_recent_drift_events(
@@ -254,28 +855,29 @@ class Database:
         limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get recent drift events"""
-        if service_id:
-            cursor = await self._connection.execute(
-                """
-                SELECT * FROM drift_events
-                WHERE service_id = ?
-                ORDER BY detected_at DESC
-                LIMIT ?
-                """,
-                (service_id, limit)
-            )
-        else:
-            cursor = await self._connection.execute(
-                """
-                SELECT * FROM drift_events
-                ORDER BY detected_at DESC
-                LIMIT ?
-                """,
-                (limit,)
-            )
-        
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._acquire_reader() as reader:
+            if service_id:
+                cursor = await reader.execute(
+                    """
+                    SELECT * FROM drift_events
+                    WHERE service_id = ?
+                    ORDER BY detected_at DESC
+                    LIMIT ?
+                    """,
+                    (service_id, limit)
+                )
+            else:
+                cursor = await reader.execute(
+                    """
+                    SELECT * FROM drift_events
+                    ORDER BY detected_at DESC
+                    LIMIT ?
+                    """,
+                    (limit,)
+                )
+            
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
     
     # Z-Score History Operations
     
@@ -288,17 +890,32 @@ class Database:
     ):
         """Insert z-score for drift tracking"""
         ts_epoch = int(timestamp.timestamp() * 1000)
-        created_at = int(datetime.now().timestamp() * 1000)
-        
-        await self._connection.execute(
-            """
-            INSERT INTO zscore_history 
-            (service_id, timestamp, latency_zscore, payload_zscore, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+        created_at = _now_ms()
+        
+        await self._write(
+            _SQL_INSERT_ZSCORE,
             (service_id, ts_epoch, latency_zscore, payload_zscore, created_at)
         )
-        await self._connection.commit()
+    
+    async def insert_zscore_batch(
+        self,
+        records: List[Tuple[str, datetime, float, float]]
+    ):
+        """
+        Insert many z-scores in a single transaction
+        
+        Args:
+            records: (service_id, timestamp, latency_zscore, payload_zscore) tuples
+        """
+        if not records:
+            return
+        
+        created_at = _now_ms()
+        rows = [
+            (service_id, int(timestamp.timestamp() * 1000), latency_zscore, payload_zscore, created_at)
+            for service_id, timestamp, latency_zscore, payload_zscore in records
+        ]
+        await self._execute_write(lambda conn: conn.executemany(_SQL_INSERT_ZSCORE, rows))
     
     async def get_recent_zscores(
         self, 
@@ -306,42 +923,82 @@ class Database:
         limit: int = 20
     ) -> List[Dict[str, Any]]:
         """Get recent z-scores for a service"""
-        cursor = await self._connection.execute(
-            """
-            SELECT * FROM zscore_history
-            WHERE service_id = ?
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (service_id, limit)
-        )
-        rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+        async with self._acquire_reader() as reader:
+            cursor = await reader.execute(
+                """
+                SELECT * FROM zscore_history
+                WHERE service_id = ?
+                ORDER BY created_at DESC
+                LIMIT ?
+                """,
+                (service_id, limit)
+            )
+            rows = await cursor.fetchall()
+            return [dict(row) for row in rows]
     
     # Maintenance Operations
     
     async def cleanup_old_data(self):
         """Remove old telemetry and events per retention policy"""
-        telemetry_cutoff = int(
-            (datetime.now() - timedelta(days=TELEMETRY_RETENTION_DAYS)).timestamp() * 1000
-        )
-        events_cutoff = int(
-            (datetime.now() - timedelta(days=DRIFT_EVENTS_RETENTION_DAYS)).timestamp() * 1000
-        )
+        now = _now_ms()
+        telemetry_cutoff = now - TELEMETRY_RETENTION_DAYS * _MS_PER_DAY
+        events_cutoff = now - DRIFT_EVENTS_RETENTION_DAYS * _MS_PER_DAY
         
-        await self._connection.execute(
-            "DELETE FROM telemetry WHERE created_at < ?",
-            (telemetry_cutoff,)
-        )
-        await self._connection.execute(
-            "DELETE FROM drift_events WHERE detected_at < ?",
-            (events_cutoff,)
+        expired = (
+            ("drift_events", "detected_at", events_cutoff),
+            ("zscore_history", "created_at", telemetry_cutoff)
         )
-        await self._connection.execute(
-            "DELETE FROM zscore_history WHERE created_at < ?",
-            (telemetry_cutoff,)
-        )
-        await self._connection.commit()
+        
+        async def delete_chunk(conn: aiosqlite.Connection) -> int:
+            # RETURNING reports which services lost rows, so the counters
+            # are decremented in the same transaction instead of recounted
+            cursor = await conn.execute(
+                """
+                DELETE FROM telemetry WHERE rowid IN (
+                    SELECT rowid FROM telemetry WHERE created_at < ? LIMIT ?
+                )
+                RETURNING service_id
+                """,
+                (telemetry_cutoff, CLEANUP_DELETE_BATCH_SIZE)
+            )
+            retired: Dict[str, int] = {}
+            for row in await cursor.fetchall():
+                retired[row[0]] = retired.get(row[0], 0) + 1
+            await conn.executemany(
+                _SQL_RETIRE_SERVICE_COUNTER,
+                [(count, service_id) for service_id, count in retired.items()]
+            )
+            
+            deleted = sum(retired.values())
+            for table, column, cutoff in expired:
+                cursor = await conn.execute(
+                    f"""
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE {column} < ? LIMIT ?
+                    )
+                    """,
+                    (cutoff, CLEANUP_DELETE_BATCH_SIZE)
+                )
+                deleted += cursor.rowcount
+            return deleted
+        
+        # Each chunk is its own short transaction so queued ingestion
+        # writes get the lock between rounds instead of waiting out the sweep
+        while await self._execute_write(delete_chunk):
+            # Retention removed rows behind the cached counts' back
+            self._count_cache.clear()
+            self._count_version += 1
+            await asyncio.sleep(0)
+        
+        if self._incremental_vacuum:
+            # Return freed pages to the filesystem a bounded slice at a time
+            async def reclaim_pages(conn: aiosqlite.Connection):
+                cursor = await conn.execute(
+                    f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES})"
+                )
+                await cursor.fetchall()
+            
+            await self._execute_write(reclaim_pages)
 
 
 # Global database instance
@@ -2,10 +2,12 @@
 DriftWatch Health State Management
 Manages service health state transitions and lifecycle
 """
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable
 from datetime import datetime
-from config import HealthState, MIN_SAMPLES_FOR_BASELINE
+from config import HealthState, MIN_SAMPLES_FOR_BASELINE, HEALTH_STATE_CACHE_SIZE
 from statistics import BaselineManager, DriftDetector
+from database import ms_to_datetime
 
 
 class HealthStateManager:
@@ -22,6 +24,17 @@ class HealthStateManager:
         self.db = db
         self.baseline_manager = BaselineManager(db)
         self.drift_detector = DriftDetector(db)
+        
+        # service_id -> current state; this manager is the only writer of
+        # health states, so entries stay valid until evicted
+        self._state_cache: OrderedDict[str, str] = OrderedDict()
+    
+    def _remember_state(self, service_id: str, state: str):
+        """Record a service's current state, evicting the least recently used"""
+        self._state_cache[service_id] = state
+        self._state_cache.move_to_end(service_id)
+        if len(self._state_cache) > HEALTH_STATE_CACHE_SIZE:
+            self._state_cache.popitem(last=False)
     
     async def get_current_state(self, service_id: str) -> str:
         """
@@ -30,8 +43,14 @@ class HealthStateManager:
         Returns:
             Current state or INSUFFICIENT_DATA if not tracked
         """
+        state = self._state_cache.get(service_id)
+        if state is not None:
+            self._state_cache.move_to_end(service_id)
+            return state
+        
         health = await self.db.get_health_state(service_id)
         if health:
+            self._remember_state(service_id, health['state'])
             return health['state']
         
         # Initialize new service
@@ -40,6 +59,7 @@ class HealthStateManager:
             state=HealthState.INSUFFICIENT_DATA,
             metadata={'reason': 'newly_tracked'}
         )
+        self._remember_state(service_id, HealthState.INSUFFICIENT_DATA)
         return HealthState.INSUFFICIENT_DATA
     
     async def transition_state(
@@ -61,12 +81,16 @@ class HealthStateManager:
         if current_state == new_state:
             return  # No transition needed
         
+        # Persist the z-scores behind this decision before recording it
+        await self.drift_detector.flush_zscores()
+        
         # Update state
         await self.db.upsert_health_state(
             service_id=service_id,
             state=new_state,
             metadata=metadata
         )
+        self._remember_state(service_id, new_state)
         
         # Record transition in audit log
         await self.db.insert_drift_event(
@@ -80,6 +104,28 @@ class HealthStateManager:
         if metadata:
             print(f"   Reason: {metadata.get('reason', 'unknown')}")
     
+    async def flush(self):
+        """Persist buffered z-scores (called on shutdown)"""
+        await self.drift_detector.flush_zscores()
+    
+    async def refresh_baselines(self, service_ids: Iterable[str]):
+        """
+        Recalculate the due baselines of services that already have one
+        
+        Called once per ingested batch so due services share one window load
+        and one upsert. Baselines are first established per sample in
+        process_telemetry, which also handles the transition to STABLE.
+        """
+        due = []
+        for service_id in service_ids:
+            if (await self.get_current_state(service_id) != HealthState.INSUFFICIENT_DATA
+                    and await self.baseline_manager.should_recalculate(service_id)):
+                due.append(service_id)
+        
+        if due:
+            for service_id in await self.baseline_manager.calculate_and_store_many(due):
+                self.drift_detector.baseline_changed(service_id)
+    
     async def process_telemetry(
         self, 
         service_id: str, 
@@ -103,6 +149,8 @@ class HealthStateManager:
         # Check if baseline needs recalculation
         if await self.baseline_manager.should_recalculate(service_id):
             baseline = await self.baseline_manager.calculate_and_store(service_id)
+            if baseline:
+                self.drift_detector.baseline_changed(service_id)
             
             # Transition from INSUFFICIENT_DATA to STABLE if baseline established
             if baseline and current_state == HealthState.INSUFFICIENT_DATA:
@@ -185,7 +233,7 @@ class HealthStateManager:
         return {
             'service_id': service_id,
             'state': health['state'],
-            'transition_timestamp': datetime.fromtimestamp(health['transition_timestamp'] / 1000),
+            'transition_timestamp': ms_to_datetime(health['transition_timestamp']),
             'sample_count': sample_count,
             'baseline': baseline,
             'metadata': metadata,
@@ -3,17 +3,30 @@ DriftWatch Telemetry Ingestion
 High-performance telemetry receiver with validation
 """
 import asyncio
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Optional, List, Tuple
 from models import TelemetryRequest
-from config import TIMESTAMP_TOLERANCE_HOURS
+from logging_queue import get_logger
+from config import (
+    TIMESTAMP_TOLERANCE_HOURS,
+    INGESTION_BATCH_MAX
+)
+
+
+log = get_logger("driftwatch.ingestion")
 
 
 class TelemetryValidator:
     """Validates incoming telemetry data"""
     
-    @staticmethod
-    def validate_timestamp(timestamp: Optional[datetime]) -> datetime:
+    # Accepted POSIX timestamp window, refreshed at most every 100ms
+    _BOUNDS_REFRESH_SECONDS = 0.1
+    _bounds: Tuple[float, float] = (0.0, 0.0)
+    _bounds_expiry: float = 0.0
+    
+    @classmethod
+    def validate_timestamp(cls, timestamp: Optional[datetime]) -> datetime:
         """
         Validate and normalize timestamp
         
@@ -32,13 +45,18 @@ class TelemetryValidator:
         if timestamp is None:
             return datetime.now()
         
-        now = datetime.now()
-        tolerance = timedelta(hours=TIMESTAMP_TOLERANCE_HOURS)
+        now = time.time()
+        if now >= cls._bounds_expiry:
+            tolerance = TIMESTAMP_TOLERANCE_HOURS * 3600
+            cls._bounds = (now - tolerance, now + tolerance)
+            cls._bounds_expiry = now + cls._BOUNDS_REFRESH_SECONDS
         
-        if timestamp < (now - tolerance) or timestamp > (now + tolerance):
+        low, high = cls._bounds
+        ts = timestamp.timestamp()
+        if ts < low or ts > high:
             raise ValueError(
                 f"Timestamp outside acceptable range: {timestamp} "
-                f"(server time: {now}, tolerance: ±{TIMESTAMP_TOLERANCE_HOURS}h)"
+                f"(server time: {datetime.fromtimestamp(now)}, tolerance: ±{TIMESTAMP_TOLERANCE_HOURS}h)"
             )
         
         return timestamp
@@ -69,6 +87,18 @@ class TelemetryValidator:
             raise ValueError(f"Payload size exceeds reasonable maximum: {payload_kb}kb")
 
 
+class TelemetryItem:
+    """Validated telemetry awaiting persistence (slotted: one per request)"""
+    
+    __slots__ = ('service_id', 'timestamp', 'latency_ms', 'payload_kb')
+    
+    def __init__(self, service_id: str, timestamp: datetime, latency_ms: float, payload_kb: float):
+        self.service_id = service_id
+        self.timestamp = timestamp
+        self.latency_ms = latency_ms
+        self.payload_kb = payload_kb
+
+
 class IngestionQueue:
     """
     Async queue for decoupling ingestion from processing
@@ -80,12 +110,12 @@ class IngestionQueue:
         self.queue = asyncio.Queue(maxsize=maxsize)
         self.processing_task: Optional[asyncio.Task] = None
     
-    async def enqueue(self, item: dict) -> bool:
+    async def enqueue(self, item: TelemetryItem) -> bool:
         """
         Add item to processing queue
         
         Args:
-            item: Telemetry data with service_id, timestamp, metrics
+            item: Validated telemetry record
         
         Returns:
             True if enqueued successfully, False if queue full
@@ -96,12 +126,29 @@ class IngestionQueue:
         except asyncio.QueueFull:
             return False
     
+    async def enqueue_many(self, items: List[TelemetryItem]) -> int:
+        """
+        Add items to processing queue until it fills
+        
+        Args:
+            items: Validated telemetry records, in arrival order
+        
+        Returns:
+            Number of items enqueued (the rest were refused by backpressure)
+        """
+        for enqueued, item in enumerate(items):
+            try:
+                self.queue.put_nowait(item)
+            except asyncio.QueueFull:
+                return enqueued
+        return len(items)
+    
     async def start_processing(self, processor_func):
         """
         Start background processing of queued items
         
         Args:
-            processor_func: Async function to process each item
+            processor_func: Async function to process a batch of items
         """
         self.processing_task = asyncio.create_task(
             self._process_loop(processor_func)
@@ -112,32 +159,25 @@ class IngestionQueue:
         """Internal processing loop"""
         while True:
             try:
-                # Get batch of items (up to 10 at once for efficiency)
-                batch = []
-                for _ in range(10):
+                # Block until the first item arrives, then drain whatever else is queued
+                batch = [await self.queue.get()]
+                while len(batch) < INGESTION_BATCH_MAX:
                     try:
-                        item = self.queue.get_nowait()
-                        batch.append(item)
+                        batch.append(self.queue.get_nowait())
                     except asyncio.QueueEmpty:
                         break
                 
-                if not batch:
-                    # Queue is empty, wait a bit
-                    await asyncio.sleep(0.1)
-                    continue
-                
                 # Process batch
-                for item in batch:
-                    try:
-                        await processor_func(item)
-                    except Exception as e:
-                        print(f"✗ Error processing telemetry: {e}")
+                try:
+                    await processor_func(batch)
+                except Exception as e:
+                    log.error(f"✗ Error processing telemetry batch: {e}")
                 
             except asyncio.CancelledError:
                 print("✓ Ingestion queue processor stopped")
                 break
             except Exception as e:
-                print(f"✗ Unexpected error in processing loop: {e}")
+                log.error(f"✗ Unexpected error in processing loop: {e}")
                 await asyncio.sleep(1)
     
     async def stop_processing(self):
@@ -174,12 +214,13 @@ class TelemetryIngestionService:
     
     async def start(self):
         """Start ingestion service"""
-        await self.queue.start_processing(self._process_telemetry)
+        await self.queue.start_processing(self._process_batch)
         print("✓ Telemetry ingestion service started")
     
     async def stop(self):
         """Stop ingestion service"""
         await self.queue.stop_processing()
+        await self.health_manager.flush()
         print("✓ Telemetry ingestion service stopped")
     
     async def ingest(self, request: TelemetryRequest) -> dict:
@@ -192,11 +233,11 @@ class TelemetryIngestionService:
             request: Validated telemetry request
         
         Returns:
-            Response dictionary with status
+            Response dictionary with status ('accepted', or 'rejected'
+            when the queue is full and backpressure applies)
         
         Raises:
             ValueError: If validation fails
-            RuntimeError: If queue is full (backpressure)
         """
         self.stats['received'] += 1
         
@@ -207,16 +248,21 @@ class TelemetryIngestionService:
         self.validator.validate_metrics(request.latency_ms, request.payload_kb)
         
         # Enqueue for processing
-        enqueued = await self.queue.enqueue({
-            'service_id': request.service_id,
-            'timestamp': timestamp,
-            'latency_ms': request.latency_ms,
-            'payload_kb': request.payload_kb
-        })
+        enqueued = await self.queue.enqueue(TelemetryItem(
+            request.service_id,
+            timestamp,
+            request.latency_ms,
+            request.payload_kb
+        ))
         
         if not enqueued:
             self.stats['rejected'] += 1
-            raise RuntimeError("Ingestion queue full - backpressure applied")
+            return {
+                'status': 'rejected',
+                'service_id': request.service_id,
+                'reason': "Ingestion queue full - backpressure applied",
+                'queue_size': self.queue.size()
+            }
         
         return {
             'status': 'accepted',
@@ -225,40 +271,105 @@ class TelemetryIngestionService:
             'queue_size': self.queue.size()
         }
     
-    async def _process_telemetry(self, item: dict):
+    async def ingest_many(self, requests: List[TelemetryRequest]) -> dict:
         """
-        Process telemetry item from queue
+        Ingest a batch of telemetry samples
+        
+        Invalid samples are reported individually and do not reject the
+        rest of the batch; valid samples are queued in one pass.
+        
+        Args:
+            requests: Validated telemetry requests
+        
+        Returns:
+            Response dictionary with status, accepted/rejected counts and
+            per-item validation errors ('rejected' status when the queue is
+            full and nothing could be accepted)
+        """
+        self.stats['received'] += len(requests)
+        
+        items = []
+        errors = []
+        for index, request in enumerate(requests):
+            try:
+                timestamp = self.validator.validate_timestamp(request.timestamp)
+                self.validator.validate_metrics(request.latency_ms, request.payload_kb)
+            except ValueError as e:
+                errors.append({'index': index, 'detail': str(e)})
+                continue
+            items.append(TelemetryItem(
+                request.service_id,
+                timestamp,
+                request.latency_ms,
+                request.payload_kb
+            ))
+        
+        accepted = await self.queue.enqueue_many(items)
+        dropped = len(items) - accepted
+        rejected = len(errors) + dropped
+        self.stats['rejected'] += rejected
+        
+        return {
+            'status': 'rejected' if dropped and not accepted else 'accepted',
+            'accepted': accepted,
+            'rejected': rejected,
+            'errors': errors,
+            'reason': "Ingestion queue full - backpressure applied" if dropped else None,
+            'queue_size': self.queue.size()
+        }
+    
+    async def _process_batch(self, batch: List[TelemetryItem]):
+        """
+        Process a batch of telemetry items from queue
         
         This runs in the background and handles:
-        1. Persistence to database
-        2. Health state evaluation
+        1. Persistence to database (one transaction per batch)
+        2. Health state evaluation (per item, in arrival order)
         
         Args:
-            item: Telemetry data dictionary
+            batch: Queued telemetry items
         """
         try:
-            # Persist to database
-            await self.db.insert_telemetry(
-                service_id=item['service_id'],
-                timestamp=item['timestamp'],
-                latency_ms=item['latency_ms'],
-                payload_kb=item['payload_kb']
-            )
-            
-            # Process through health state manager
-            await self.health_manager.process_telemetry(
-                service_id=item['service_id'],
-                latency_ms=item['latency_ms'],
-                payload_kb=item['payload_kb'],
-                timestamp=item['timestamp']
-            )
-            
-            self.stats['processed'] += 1
-            
+            await self.db.insert_telemetry_batch([
+                (item.service_id, item.timestamp, item.latency_ms, item.payload_kb)
+                for item in batch
+            ])
         except Exception as e:
-            print(f"✗ Failed to process telemetry for {item['service_id']}: {e}")
-            self.stats['rejected'] += 1
-            raise
+            log.error(f"✗ Failed to persist telemetry batch of {len(batch)}: {e}")
+            self.stats['rejected'] += len(batch)
+            return
+        
+        # Keep in-memory baseline windows in step with the persisted rows,
+        # one vectorized update per service
+        by_service = {}
+        for item in batch:
+            latencies, payloads = by_service.setdefault(item.service_id, ([], []))
+            latencies.append(item.latency_ms)
+            payloads.append(item.payload_kb)
+        baseline_manager = self.health_manager.baseline_manager
+        for service_id, (latencies, payloads) in by_service.items():
+            baseline_manager.observe_many(service_id, latencies, payloads)
+        
+        try:
+            await self.health_manager.refresh_baselines(by_service)
+        except Exception as e:
+            log.error(f"✗ Failed to refresh baselines for batch of {len(batch)}: {e}")
+        
+        for item in batch:
+            try:
+                # Process through health state manager
+                await self.health_manager.process_telemetry(
+                    service_id=item.service_id,
+                    latency_ms=item.latency_ms,
+                    payload_kb=item.payload_kb,
+                    timestamp=item.timestamp
+                )
+                
+                self.stats['processed'] += 1
+                
+            except Exception as e:
+                log.error(f"✗ Failed to process telemetry for {item.service_id}: {e}")
+                self.stats['rejected'] += 1
     
     def get_stats(self) -> dict:
         """Get ingestion statistics"""
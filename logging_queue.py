@@ -0,0 +1,51 @@
+"""
+DriftWatch Non-blocking Logging
+Log records are queued by the caller and written to stdout by a background thread
+"""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: QueueListener = None
+
+
+def _start_listener():
+    """Start the shared writer thread (once per process)"""
+    global _listener
+    if _listener is not None:
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(_log_queue, handler)
+    _listener.start()
+    
+    # Flush queued records before the interpreter exits
+    atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a logger whose records are written off the calling thread
+    
+    Enqueueing a record never blocks on stdout, so logging from the
+    event loop doesn't stall request handling or send scheduling.
+    
+    Args:
+        name: Logger name (e.g. "driftwatch.ingestion")
+    
+    Returns:
+        Configured logger
+    """
+    _start_listener()
+    
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, QueueHandler) for h in logger.handlers):
+        logger.addHandler(QueueHandler(_log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
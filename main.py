@@ -6,20 +6,27 @@ import os
 import time
 from datetime import datetime
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Callable, Optional
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
 
 from models import (
     TelemetryRequest, TelemetryResponse,
+    TelemetryBatchRequest, TelemetryBatchResponse,
     HealthStatus, BaselineStats, SystemStatus,
     SimulationRequest, SimulationResponse
 )
-from database import db
+from database import db, ms_to_datetime
 from health import HealthStateManager
 from ingestion import TelemetryIngestionService
-from config import API_HOST, API_PORT, HealthState
+from config import API_HOST, API_PORT, HealthState, SYSTEM_STATUS_CACHE_SECONDS
+from logging_queue import get_logger
+
+
+log = get_logger("driftwatch.api")
 
 
 # Application startup/shutdown lifecycle
@@ -47,6 +54,9 @@ async def lifespan(app: FastAPI):
     # Track startup time
     app.state.startup_time = time.time()
     
+    # (expires_at, services_count, total_records, db_size_mb) for /v1/system/status
+    app.state.status_snapshot = (0.0, 0, 0, 0.0)
+    
     print("✓ DriftWatch is ready")
     print(f"✓ API listening on http://{API_HOST}:{API_PORT}")
     print("=" * 60)
@@ -62,13 +72,36 @@ async def lifespan(app: FastAPI):
     print("=" * 60)
 
 
+class ORJSONRequest(Request):
+    """Request whose JSON body is parsed with orjson"""
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """Route that hands endpoints an ORJSONRequest (Pydantic validation unchanged)"""
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+        
+        return orjson_route_handler
+
+
 # Create FastAPI application
 app = FastAPI(
     title="DriftWatch",
     description="Statistical Drift Detection Platform for Service Reliability",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
+app.router.route_class = ORJSONRoute
 
 
 # ============================================================================
@@ -96,11 +129,22 @@ async def ingest_telemetry(request: TelemetryRequest):
     try:
         result = await app.state.ingestion_service.ingest(request)
         
-        return TelemetryResponse(
-            status="accepted",
-            service_id=result['service_id'],
-            timestamp=result['timestamp'],
-            message=f"Telemetry queued for processing (queue size: {result['queue_size']})"
+        if result['status'] == 'rejected':
+            # Backpressure: answer directly rather than raising on the overload path
+            return ORJSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": result['reason']}
+            )
+        
+        # Fixed response shape: serialize directly instead of building a TelemetryResponse
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "status": "accepted",
+                "service_id": result['service_id'],
+                "timestamp": result['timestamp'],
+                "message": f"Telemetry queued for processing (queue size: {result['queue_size']})"
+            }
         )
     
     except ValueError as e:
@@ -108,13 +152,56 @@ async def ingest_telemetry(request: TelemetryRequest):
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=str(e)
         )
-    except RuntimeError as e:
+    except Exception as e:
+        log.exception(f"✗ Unexpected error in telemetry ingestion: {e}")
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=str(e)
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error during telemetry ingestion"
+        )
+
+
+@app.post(
+    "/v1/telemetry/batch",
+    response_model=TelemetryBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Ingestion"]
+)
+async def ingest_telemetry_batch(request: TelemetryBatchRequest):
+    """
+    Ingest many telemetry samples in one request
+    
+    Preferred for high-volume senders: one HTTP round trip and one queue
+    pass per batch instead of per sample. Samples failing validation are
+    listed in **errors** (by index) without rejecting the rest.
+    
+    - **items**: Telemetry samples, same fields as POST /v1/telemetry
+    """
+    try:
+        result = await app.state.ingestion_service.ingest_many(request.items)
+        
+        if result['status'] == 'rejected':
+            return ORJSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"detail": result['reason']}
+            )
+        
+        message = f"Telemetry queued for processing (queue size: {result['queue_size']})"
+        if result['reason']:
+            message = f"{result['reason']}; {message}"
+        
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "status": "accepted",
+                "accepted": result['accepted'],
+                "rejected": result['rejected'],
+                "errors": result['errors'],
+                "message": message
+            }
         )
+    
     except Exception as e:
-        print(f"✗ Unexpected error in telemetry ingestion: {e}")
+        log.exception(f"✗ Unexpected error in batch telemetry ingestion: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during telemetry ingestion"
@@ -153,8 +240,8 @@ async def get_service_health(service_id: str):
                 stddev_latency=b['stddev_latency'],
                 mean_payload=b['mean_payload'],
                 stddev_payload=b['stddev_payload'],
-                last_updated=datetime.fromtimestamp(b['last_updated'] / 1000),
-                created_at=datetime.fromtimestamp(b['created_at'] / 1000)
+                last_updated=ms_to_datetime(b['last_updated']),
+                created_at=ms_to_datetime(b['created_at'])
             )
         
         return HealthStatus(
@@ -167,7 +254,7 @@ async def get_service_health(service_id: str):
         )
     
     except Exception as e:
-        print(f"✗ Error retrieving health for {service_id}: {e}")
+        log.exception(f"✗ Error retrieving health for {service_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve health status: {str(e)}"
@@ -204,14 +291,14 @@ async def get_service_baseline(service_id: str):
             stddev_latency=baseline['stddev_latency'],
             mean_payload=baseline['mean_payload'],
             stddev_payload=baseline['stddev_payload'],
-            last_updated=datetime.fromtimestamp(baseline['last_updated'] / 1000),
-            created_at=datetime.fromtimestamp(baseline['created_at'] / 1000)
+            last_updated=ms_to_datetime(baseline['last_updated']),
+            created_at=ms_to_datetime(baseline['created_at'])
         )
     
     except HTTPException:
         raise
     except Exception as e:
-        print(f"✗ Error retrieving baseline for {service_id}: {e}")
+        log.exception(f"✗ Error retrieving baseline for {service_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve baseline: {str(e)}"
@@ -236,15 +323,21 @@ async def get_system_status():
     """
     try:
         uptime = time.time() - app.state.startup_time
-        services_count = await db.get_monitored_services_count()
-        total_records = await db.get_total_telemetry_count()
         
-        # Get database file size
-        db_size_bytes = os.path.getsize(db.db_path) if os.path.exists(db.db_path) else 0
-        db_size_mb = db_size_bytes / (1024 * 1024)
-        
-        # Get ingestion stats
-        ingestion_stats = app.state.ingestion_service.get_stats()
+        # Counts and file size change slowly; refresh them at most every
+        # SYSTEM_STATUS_CACHE_SECONDS rather than on every scrape
+        expires_at, services_count, total_records, db_size_mb = app.state.status_snapshot
+        now = time.monotonic()
+        if now >= expires_at:
+            services_count, total_records = await db.get_telemetry_totals()
+            try:
+                db_size_bytes = os.path.getsize(db.db_path)
+            except OSError:
+                db_size_bytes = 0
+            db_size_mb = db_size_bytes / (1024 * 1024)
+            app.state.status_snapshot = (
+                now + SYSTEM_STATUS_CACHE_SECONDS, services_count, total_records, db_size_mb
+            )
         
         return SystemStatus(
             status="healthy",
@@ -256,7 +349,7 @@ async def get_system_status():
         )
     
     except Exception as e:
-        print(f"✗ Error retrieving system status: {e}")
+        log.exception(f"✗ Error retrieving system status: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve system status: {str(e)}"
@@ -272,6 +365,7 @@ async def root():
         "description": "Statistical Drift Detection Platform for Service Reliability",
         "endpoints": {
             "telemetry": "POST /v1/telemetry",
+            "telemetry_batch": "POST /v1/telemetry/batch",
             "health": "GET /v1/health/{service_id}",
             "baseline": "GET /v1/baseline/{service_id}",
             "system": "GET /v1/system/status"
@@ -293,8 +387,8 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Catch-all exception handler"""
-    print(f"✗ Unhandled exception: {exc}")
-    return JSONResponse(
+    log.error(f"✗ Unhandled exception: {exc}", exc_info=exc)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": "Internal server error",
@@ -315,5 +409,7 @@ if __name__ == "__main__":
         host=API_HOST,
         port=API_PORT,
         log_level="info",
-        access_log=True
+        access_log=False,  # Skip per-request access log formatting
+        loop="uvloop",
+        http="httptools"
     )
\ No newline at end of file
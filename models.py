@@ -2,10 +2,14 @@
 DriftWatch Data Models
 Pydantic schemas for API request/response validation
 """
+import re
 from datetime import datetime
 from typing import Optional, List
 from pydantic import BaseModel, Field, validator
-from config import MAX_SERVICE_ID_LENGTH
+from config import MAX_SERVICE_ID_LENGTH, TELEMETRY_BATCH_MAX_ITEMS
+
+# Any character other than alphanumerics, hyphen, underscore or dot
+_SERVICE_ID_DISALLOWED = re.compile(r'[^\w.\-]')
 
 
 class TelemetryRequest(BaseModel):
@@ -18,7 +22,7 @@ class TelemetryRequest(BaseModel):
     @validator('service_id')
     def validate_service_id(cls, v):
         """Ensure service_id contains only valid characters"""
-        if not all(c.isalnum() or c in '-_.' for c in v):
+        if _SERVICE_ID_DISALLOWED.search(v):
             raise ValueError('service_id must contain only alphanumeric, hyphens, underscores, or dots')
         return v
 
@@ -41,6 +45,30 @@ class TelemetryResponse(BaseModel):
     message: Optional[str] = None
 
 
+class TelemetryBatchRequest(BaseModel):
+    """Many telemetry samples submitted in one request"""
+    items: List[TelemetryRequest] = Field(..., min_length=1, max_length=TELEMETRY_BATCH_MAX_ITEMS)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"service_id": "payment-authorization-prod", "latency_ms": 156.7, "payload_kb": 2.3},
+                    {"service_id": "payment-authorization-prod", "latency_ms": 149.2, "payload_kb": 2.1}
+                ]
+            }
+        }
+
+
+class TelemetryBatchResponse(BaseModel):
+    """Response after batch telemetry ingestion"""
+    status: str
+    accepted: int
+    rejected: int
+    errors: List[dict] = []
+    message: Optional[str] = None
+
+
 class BaselineStats(BaseModel):
     """Statistical baseline for a service"""
     service_id: str
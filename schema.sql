@@ -13,12 +13,19 @@ CREATE TABLE IF NOT EXISTS telemetry (
     CONSTRAINT chk_payload CHECK (payload_kb >= 0)
 );
 
+-- Serves get_recent_telemetry: index range scan, no sort step
 CREATE INDEX IF NOT EXISTS idx_telemetry_service_time 
 ON telemetry(service_id, timestamp DESC);
 
 CREATE INDEX IF NOT EXISTS idx_telemetry_created 
 ON telemetry(created_at);
 
+-- Per-Service Counters (maintained in the telemetry insert transaction)
+CREATE TABLE IF NOT EXISTS service_counters (
+    service_id TEXT PRIMARY KEY,
+    telemetry_count INTEGER NOT NULL DEFAULT 0
+);
+
 -- Service Baselines
 CREATE TABLE IF NOT EXISTS baselines (
     service_id TEXT PRIMARY KEY,
@@ -30,6 +37,9 @@ CREATE TABLE IF NOT EXISTS baselines (
     p50_latency REAL,
     p95_latency REAL,
     p99_latency REAL,
+    -- Running sample count: seeded from the baseline window, advanced on
+    -- every insert (drives recalculation)
+    n INTEGER NOT NULL DEFAULT 0,
     last_updated INTEGER NOT NULL,
     created_at INTEGER NOT NULL,
     CONSTRAINT chk_sample_count CHECK (sample_count > 0)
@@ -51,13 +61,17 @@ CREATE TABLE IF NOT EXISTS drift_events (
     detected_at INTEGER NOT NULL,
     previous_state TEXT NOT NULL,
     new_state TEXT NOT NULL,
-    trigger_samples TEXT,  -- JSON array of recent z-scores
-    metadata TEXT  -- Additional context
+    trigger_samples BLOB,  -- JSON array of recent z-scores (UTF-8 bytes)
+    metadata BLOB  -- Additional context (UTF-8 JSON bytes)
 );
 
+-- Serves get_recent_drift_events(service_id)
 CREATE INDEX IF NOT EXISTS idx_drift_events_service 
 ON drift_events(service_id, detected_at DESC);
 
+CREATE INDEX IF NOT EXISTS idx_drift_events_detected 
+ON drift_events(detected_at);
+
 -- Z-Score History (for drift detection)
 CREATE TABLE IF NOT EXISTS zscore_history (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -68,9 +82,13 @@ CREATE TABLE IF NOT EXISTS zscore_history (
     created_at INTEGER NOT NULL
 );
 
+-- Serves get_recent_zscores
 CREATE INDEX IF NOT EXISTS idx_zscore_service_time 
 ON zscore_history(service_id, created_at DESC);
 
+CREATE INDEX IF NOT EXISTS idx_zscore_created 
+ON zscore_history(created_at);
+
 -- Simulation Tracking (internal)
 CREATE TABLE IF NOT EXISTS simulations (
     simulation_id TEXT PRIMARY KEY,
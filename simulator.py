@@ -10,24 +10,72 @@ Usage:
 """
 import asyncio
 import argparse
+import math
 import sys
 from datetime import datetime
-from typing import List, Tuple
+from typing import Optional, Tuple
 import numpy as np
 import httpx
+from logging_queue import get_logger
+
+
+log = get_logger("driftwatch.simulator")
+
+# Log-normal parameters of the default payload distribution (mean 2.5 KB, std 0.8 KB)
+_PAYLOAD_MU = math.log(2.5)
+_PAYLOAD_SIGMA = 0.8 / 2.5
 
 
 class TrafficGenerator:
     """Generates synthetic telemetry with configurable patterns"""
     
+    @staticmethod
+    def _fill_normal(
+        rng: np.random.Generator,
+        latencies: np.ndarray,
+        payloads: np.ndarray,
+        latency_mean: float = 150.0,
+        latency_std: float = 25.0,
+        payload_mean: float = 2.5,
+        payload_std: float = 0.8
+    ):
+        """
+        Write a normal traffic pattern into preallocated arrays in place
+        
+        Args:
+            rng: Random generator to draw from
+            latencies: Output array for latencies (ms)
+            payloads: Output array for payload sizes (KB), same length
+        """
+        # Normal distribution for latency
+        rng.standard_normal(out=latencies)
+        latencies *= latency_std
+        latencies += latency_mean
+        np.clip(latencies, 1, None, out=latencies)  # Ensure positive
+        
+        # Log-normal distribution for payload (more realistic)
+        TrafficGenerator._fill_lognormal(
+            rng, payloads, math.log(payload_mean), payload_std / payload_mean
+        )
+    
+    @staticmethod
+    def _fill_lognormal(rng: np.random.Generator, payloads: np.ndarray, mu: float, sigma: float):
+        """Write log-normal payload sizes (floored at 0.1 KB) into an array in place"""
+        rng.standard_normal(out=payloads)
+        payloads *= sigma
+        payloads += mu
+        np.exp(payloads, out=payloads)
+        np.clip(payloads, 0.1, None, out=payloads)
+    
     @staticmethod
     def generate_normal(
         count: int,
         latency_mean: float = 150.0,
         latency_std: float = 25.0,
         payload_mean: float = 2.5,
-        payload_std: float = 0.8
-    ) -> List[Tuple[float, float]]:
+        payload_std: float = 0.8,
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Generate normal/healthy traffic pattern
         
@@ -37,31 +85,27 @@ class TrafficGenerator:
             latency_std: Standard deviation of latency
             payload_mean: Mean payload size in KB
             payload_std: Standard deviation of payload
+            rng: Random generator (default: a fresh PCG64 generator)
         
         Returns:
-            List of (latency_ms, payload_kb) tuples
+            Tuple of (latencies_ms, payloads_kb) arrays
         """
-        # Normal distribution for latency
-        latencies = np.random.normal(latency_mean, latency_std, count)
-        latencies = np.clip(latencies, 1, None)  # Ensure positive
-        
-        # Log-normal distribution for payload (more realistic)
-        payloads = np.random.lognormal(
-            np.log(payload_mean), 
-            payload_std / payload_mean, 
-            count
+        latencies = np.empty(count)
+        payloads = np.empty(count)
+        TrafficGenerator._fill_normal(
+            rng or np.random.default_rng(), latencies, payloads,
+            latency_mean, latency_std, payload_mean, payload_std
         )
-        payloads = np.clip(payloads, 0.1, None)
-        
-        return list(zip(latencies.tolist(), payloads.tolist()))
+        return latencies, payloads
     
     @staticmethod
     def generate_spike(
         total_duration: int,
         samples_per_sec: int,
         normal_latency: float = 150.0,
-        spike_latency: float = 500.0
-    ) -> List[Tuple[float, float, float]]:
+        spike_latency: float = 500.0,
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generate traffic with sudden spike in the middle
         
@@ -75,50 +119,44 @@ class TrafficGenerator:
             samples_per_sec: Samples per second
             normal_latency: Baseline latency
             spike_latency: Spiked latency
+            rng: Random generator (default: a fresh PCG64 generator)
         
         Returns:
-            List of (latency_ms, payload_kb, timestamp_offset) tuples
+            Tuple of (latencies_ms, payloads_kb, timestamp_offsets) arrays
         """
+        rng = rng or np.random.default_rng()
         total_samples = total_duration * samples_per_sec
         
         # Calculate phase boundaries
         phase1_end = int(total_samples * 0.4)
         phase2_end = int(total_samples * 0.7)
         
-        samples = []
-        
-        # Phase 1: Normal (40%)
-        phase1 = TrafficGenerator.generate_normal(phase1_end)
-        for i, (lat, pay) in enumerate(phase1):
-            samples.append((lat, pay, i / samples_per_sec))
+        # Per-sample latency distribution: normal (40%), spike (30%), recovery (30%)
+        means = np.full(total_samples, normal_latency)
+        stds = np.full(total_samples, 25.0)
+        means[phase1_end:phase2_end] = spike_latency
+        stds[phase1_end:phase2_end] = spike_latency * 0.15
         
-        # Phase 2: Spike (30%)
-        phase2_count = phase2_end - phase1_end
-        phase2 = TrafficGenerator.generate_normal(
-            phase2_count,
-            latency_mean=spike_latency,
-            latency_std=spike_latency * 0.15
-        )
-        for i, (lat, pay) in enumerate(phase2):
-            offset = (phase1_end + i) / samples_per_sec
-            samples.append((lat, pay, offset))
+        # One draw covers all three phases
+        latencies = rng.standard_normal(total_samples)
+        latencies *= stds
+        latencies += means
+        np.clip(latencies, 1, None, out=latencies)
         
-        # Phase 3: Recovery (30%)
-        phase3_count = total_samples - phase2_end
-        phase3 = TrafficGenerator.generate_normal(phase3_count)
-        for i, (lat, pay) in enumerate(phase3):
-            offset = (phase2_end + i) / samples_per_sec
-            samples.append((lat, pay, offset))
+        payloads = np.empty(total_samples)
+        TrafficGenerator._fill_lognormal(rng, payloads, _PAYLOAD_MU, _PAYLOAD_SIGMA)
         
-        return samples
+        offsets = np.arange(total_samples) / samples_per_sec
+        return latencies, payloads, offsets
     
     @staticmethod
     def generate_creep(
         total_duration: int,
         samples_per_sec: int,
         start_latency: float = 150.0,
-        end_latency: float = 300.0
-    ) -> List[Tuple[float, float, float]]:
+        end_latency: float = 300.0,
+        rng: Optional[np.random.Generator] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Generate traffic with gradual latency increase (creep)
         
@@ -129,38 +167,39 @@ class TrafficGenerator:
             samples_per_sec: Samples per second
             start_latency: Initial latency
             end_latency: Final latency
+            rng: Random generator (default: a fresh PCG64 generator)
         
         Returns:
-            List of (latency_ms, payload_kb, timestamp_offset) tuples
+            Tuple of (latencies_ms, payloads_kb, timestamp_offsets) arrays
         """
+        rng = rng or np.random.default_rng()
         total_samples = total_duration * samples_per_sec
-        samples = []
         
-        for i in range(total_samples):
-            # Linear interpolation of mean latency
-            progress = i / total_samples
-            current_mean = start_latency + (end_latency - start_latency) * progress
-            current_std = current_mean * 0.15
-            
-            # Generate sample with current mean
-            latency = np.random.normal(current_mean, current_std)
-            latency = max(1, latency)
-            
-            payload = np.random.lognormal(np.log(2.5), 0.32)
-            payload = max(0.1, payload)
-            
-            offset = i / samples_per_sec
-            samples.append((latency, payload, offset))
+        # Linear interpolation of mean latency, one draw for all samples
+        progress = np.arange(total_samples) / total_samples
+        means = start_latency + (end_latency - start_latency) * progress
+        latencies = rng.standard_normal(total_samples)
+        latencies *= means * 0.15
+        latencies += means
+        np.clip(latencies, 1, None, out=latencies)
+        
+        payloads = np.empty(total_samples)
+        TrafficGenerator._fill_lognormal(rng, payloads, _PAYLOAD_MU, _PAYLOAD_SIGMA)
         
-        return samples
+        offsets = np.arange(total_samples) / samples_per_sec
+        return latencies, payloads, offsets
 
 
 class DriftWatchSimulator:
     """Simulates traffic to DriftWatch API"""
     
-    def __init__(self, api_url: str = "http://localhost:8000"):
+    SEND_TICK_SECONDS = 0.1  # Samples due within a tick are released together
+    
+    def __init__(self, api_url: str = "http://localhost:8000", max_in_flight: int = 32):
         self.api_url = api_url
+        self.max_in_flight = max_in_flight  # Concurrent telemetry requests
         self.client = None
+        self._rng = np.random.default_rng()  # Shared across runs of this simulator
     
     async def send_telemetry(
         self, 
@@ -191,9 +230,24 @@ class DriftWatchSimulator:
             )
             return response.status_code in (200, 202)
         except Exception as e:
-            print(f"✗ Failed to send telemetry: {e}")
+            log.warning(f"✗ Failed to send telemetry: {e}")
             return False
     
+    async def _send_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        results: dict,
+        service_id: str,
+        latency_ms: float,
+        payload_kb: float
+    ):
+        """Send one sample and release its in-flight slot"""
+        try:
+            success = await self.send_telemetry(service_id, latency_ms, payload_kb)
+        finally:
+            semaphore.release()
+        results['sent' if success else 'failed'] += 1
+    
     async def check_health(self, service_id: str) -> dict:
         """Query service health state"""
         try:
@@ -205,7 +259,7 @@ class DriftWatchSimulator:
                 return response.json()
             return None
         except Exception as e:
-            print(f"✗ Failed to check health: {e}")
+            log.warning(f"✗ Failed to check health: {e}")
             return None
     
     async def run_simulation(
@@ -224,91 +278,99 @@ class DriftWatchSimulator:
             duration: Duration in seconds
             samples_per_sec: Sampling rate
         """
-        print("=" * 70)
-        print(f"DriftWatch Traffic Simulator")
-        print("=" * 70)
-        print(f"Service:   {service_id}")
-        print(f"Mode:      {mode}")
-        print(f"Duration:  {duration}s")
-        print(f"Rate:      {samples_per_sec} samples/sec")
-        print(f"API:       {self.api_url}")
-        print("=" * 70)
+        log.info("=" * 70)
+        log.info(f"DriftWatch Traffic Simulator")
+        log.info("=" * 70)
+        log.info(f"Service:   {service_id}")
+        log.info(f"Mode:      {mode}")
+        log.info(f"Duration:  {duration}s")
+        log.info(f"Rate:      {samples_per_sec} samples/sec")
+        log.info(f"API:       {self.api_url}")
+        log.info("=" * 70)
         
         # Generate traffic pattern
-        print(f"\n⚙ Generating {mode} traffic pattern...")
+        log.info(f"\n⚙ Generating {mode} traffic pattern...")
         
         if mode == "NORMAL":
-            samples = TrafficGenerator.generate_normal(
-                duration * samples_per_sec
+            latencies, payloads = TrafficGenerator.generate_normal(
+                duration * samples_per_sec, rng=self._rng
             )
             # Add time offsets
-            samples = [(lat, pay, i / samples_per_sec) 
-                      for i, (lat, pay) in enumerate(samples)]
+            offsets = np.arange(len(latencies)) / samples_per_sec
         
         elif mode == "SPIKE":
-            samples = TrafficGenerator.generate_spike(
-                duration, samples_per_sec
+            latencies, payloads, offsets = TrafficGenerator.generate_spike(
+                duration, samples_per_sec, rng=self._rng
             )
         
         elif mode == "CREEP":
-            samples = TrafficGenerator.generate_creep(
-                duration, samples_per_sec
+            latencies, payloads, offsets = TrafficGenerator.generate_creep(
+                duration, samples_per_sec, rng=self._rng
             )
         
         else:
-            print(f"✗ Unknown mode: {mode}")
+            log.info(f"✗ Unknown mode: {mode}")
             return
         
-        print(f"✓ Generated {len(samples)} samples")
+        total_samples = len(latencies)
+        log.info(f"✓ Generated {total_samples} samples")
         
-        # Initialize HTTP client
-        async with httpx.AsyncClient() as client:
+        # Initialize HTTP client (pooled keep-alive connections)
+        limits = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+        async with httpx.AsyncClient(limits=limits, timeout=5.0) as client:
             self.client = client
             
             # Check API health
             try:
                 response = await client.get(f"{self.api_url}/health", timeout=5.0)
                 if response.status_code != 200:
-                    print(f"✗ DriftWatch API not responding at {self.api_url}")
+                    log.info(f"✗ DriftWatch API not responding at {self.api_url}")
                     return
-                print(f"✓ DriftWatch API is healthy")
+                log.info(f"✓ DriftWatch API is healthy")
             except Exception as e:
-                print(f"✗ Cannot connect to DriftWatch API: {e}")
+                log.info(f"✗ Cannot connect to DriftWatch API: {e}")
                 return
             
             # Send telemetry
-            print(f"\n📊 Sending telemetry...")
-            start_time = asyncio.get_event_loop().time()
-            sent_count = 0
-            failed_count = 0
+            log.info(f"\n📊 Sending telemetry...")
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            results = {'sent': 0, 'failed': 0}
+            
+            # Requests overlap so round-trip time doesn't cap the send rate
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            in_flight = set()
             
             last_health_check = 0
             health_check_interval = max(duration // 10, 5)  # Check 10 times
+            progress_interval = samples_per_sec * 5
             
-            for i, (latency, payload, offset) in enumerate(samples):
-                # Wait until correct time offset
-                target_time = start_time + offset
-                current_time = asyncio.get_event_loop().time()
-                wait_time = target_time - current_time
-                
+            # One timer wakeup per tick instead of one per sample
+            released = 0
+            next_tick = 0.0
+            while released < total_samples:
+                wait_time = start_time + next_tick - loop.time()
                 if wait_time > 0:
                     await asyncio.sleep(wait_time)
                 
-                # Send telemetry
-                success = await self.send_telemetry(service_id, latency, payload)
-                if success:
-                    sent_count += 1
-                else:
-                    failed_count += 1
+                elapsed = loop.time() - start_time
+                due = int(np.searchsorted(offsets, elapsed, side='right'))
                 
-                # Calculate elapsed time
-                elapsed = asyncio.get_event_loop().time() - start_time
+                # Send telemetry (waits only when max_in_flight are outstanding)
+                for i in range(released, due):
+                    await semaphore.acquire()
+                    task = asyncio.create_task(self._send_bounded(
+                        semaphore, results, service_id, float(latencies[i]), float(payloads[i])
+                    ))
+                    in_flight.add(task)
+                    task.add_done_callback(in_flight.discard)
                 
                 # Progress indicator
-                if (i + 1) % (samples_per_sec * 5) == 0:
-                    print(f"  [{elapsed:6.1f}s] Sent: {sent_count:4d} | "
-                          f"Failed: {failed_count:2d} | "
-                          f"Latest: lat={latency:6.1f}ms pay={payload:4.1f}kb")
+                if due // progress_interval > released // progress_interval:
+                    log.info(f"  [{elapsed:6.1f}s] Sent: {results['sent']:4d} | "
+                             f"Failed: {results['failed']:2d} | "
+                             f"Latest: lat={latencies[due - 1]:6.1f}ms pay={payloads[due - 1]:4.1f}kb")
+                released = due
                 
                 # Periodic health check
                 if elapsed - last_health_check >= health_check_interval:
@@ -316,35 +378,42 @@ class DriftWatchSimulator:
                     if health:
                         state = health.get('state', 'UNKNOWN')
                         sample_count = health.get('sample_count', 0)
-                        print(f"  ⚡ Health: {state} (samples: {sample_count})")
+                        log.info(f"  ⚡ Health: {state} (samples: {sample_count})")
                     last_health_check = elapsed
+                
+                next_tick = (elapsed // self.SEND_TICK_SECONDS + 1) * self.SEND_TICK_SECONDS
+            
+            # Wait for outstanding requests
+            await asyncio.gather(*in_flight)
+            sent_count = results['sent']
+            failed_count = results['failed']
             
             # Final statistics
-            total_time = asyncio.get_event_loop().time() - start_time
-            print(f"\n{'=' * 70}")
-            print(f"Simulation Complete")
-            print(f"{'=' * 70}")
-            print(f"Total time:      {total_time:.1f}s")
-            print(f"Samples sent:    {sent_count}")
-            print(f"Failed:          {failed_count}")
-            print(f"Success rate:    {(sent_count/len(samples))*100:.1f}%")
+            total_time = loop.time() - start_time
+            log.info(f"\n{'=' * 70}")
+            log.info(f"Simulation Complete")
+            log.info(f"{'=' * 70}")
+            log.info(f"Total time:      {total_time:.1f}s")
+            log.info(f"Samples sent:    {sent_count}")
+            log.info(f"Failed:          {failed_count}")
+            log.info(f"Success rate:    {(sent_count/total_samples)*100:.1f}%")
             
             # Final health check
-            print(f"\n📋 Final Health Status:")
+            log.info(f"\n📋 Final Health Status:")
             health = await self.check_health(service_id)
             if health:
-                print(f"  State:           {health.get('state')}")
-                print(f"  Samples:         {health.get('sample_count')}")
-                print(f"  Transition:      {health.get('transition_timestamp')}")
+                log.info(f"  State:           {health.get('state')}")
+                log.info(f"  Samples:         {health.get('sample_count')}")
+                log.info(f"  Transition:      {health.get('transition_timestamp')}")
                 
                 if health.get('baseline'):
                     baseline = health['baseline']
-                    print(f"\n  Baseline:")
-                    print(f"    Mean latency:  {baseline.get('mean_latency', 0):.2f}ms")
-                    print(f"    Std dev:       {baseline.get('stddev_latency', 0):.2f}ms")
-                    print(f"    Sample count:  {baseline.get('sample_count', 0)}")
+                    log.info(f"\n  Baseline:")
+                    log.info(f"    Mean latency:  {baseline.get('mean_latency', 0):.2f}ms")
+                    log.info(f"    Std dev:       {baseline.get('stddev_latency', 0):.2f}ms")
+                    log.info(f"    Sample count:  {baseline.get('sample_count', 0)}")
             
-            print(f"{'=' * 70}")
+            log.info(f"{'=' * 70}")
 
 
 async def main():
@@ -380,10 +449,19 @@ async def main():
         default="http://localhost:8000",
         help="DriftWatch API URL (default: http://localhost:8000)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="Maximum concurrent telemetry requests (default: 32)"
+    )
     
     args = parser.parse_args()
     
-    simulator = DriftWatchSimulator(api_url=args.api_url)
+    simulator = DriftWatchSimulator(
+        api_url=args.api_url,
+        max_in_flight=args.concurrency
+    )
     
     try:
         await simulator.run_simulation(
@@ -393,7 +471,7 @@ async def main():
             samples_per_sec=args.rate
         )
     except KeyboardInterrupt:
-        print("\n\n✗ Simulation interrupted by user")
+        log.info("\n\n✗ Simulation interrupted by user")
         sys.exit(1)
 
 
@@ -0,0 +1,93 @@
+"""
+DriftWatch Statistical Kernels
+Compiled numeric kernels for baseline calculation
+
+Numba is optional: when it is installed the kernels are JIT-compiled
+(and cached on disk), otherwise the equivalent NumPy implementations
+are used.
+"""
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+BaselineResult = Tuple[float, float, float, float, float, int]
+
+
+def _baseline_numpy(a: np.ndarray) -> BaselineResult:
+    """NumPy implementation of baseline_kernel"""
+    n = a.size
+    
+    # Sum and sum of squares in one pass each, shifted by the first
+    # sample so the variance doesn't lose precision to cancellation
+    shifted = a - a[0]
+    total = shifted.sum()
+    total_sq = np.dot(shifted, shifted)
+    mean = a[0] + total / n
+    variance = max((total_sq - total * total / n) / (n - 1), 0.0)  # Sample variance
+    
+    # Percentiles from one sort (linear interpolation, as np.percentile)
+    ordered = np.sort(a)
+    position = np.array([0.50, 0.95, 0.99]) * (n - 1)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    p50, p95, p99 = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+    
+    return float(mean), float(np.sqrt(variance)), float(p50), float(p95), float(p99), n
+
+
+def _baseline_loop(a):
+    """Single-loop implementation of baseline_kernel (compiled by Numba)"""
+    n = a.size
+    
+    # Shifted sum and sum of squares in one loop
+    shift = a[0]
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        d = a[i] - shift
+        total += d
+        total_sq += d * d
+    mean = shift + total / n
+    variance = max((total_sq - total * total / n) / (n - 1), 0.0)
+    
+    ordered = np.sort(a)
+    result = np.empty(3)
+    for k, q in enumerate((0.50, 0.95, 0.99)):
+        position = q * (n - 1)
+        lower = int(position)
+        upper = min(lower + 1, n - 1)
+        result[k] = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+    
+    return mean, np.sqrt(variance), result[0], result[1], result[2], n
+
+
+if NUMBA_AVAILABLE:
+    _baseline_compiled = njit(cache=True, fastmath=True)(_baseline_loop)
+
+
+def baseline_kernel(a: np.ndarray) -> BaselineResult:
+    """
+    Compute baseline moments and percentiles of a sample window
+    
+    Args:
+        a: Samples (at least two)
+    
+    Returns:
+        Tuple of (mean, sample stddev, p50, p95, p99, sample_count)
+    """
+    a = np.ascontiguousarray(a, dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        mean, stddev, p50, p95, p99, n = _baseline_compiled(a)
+        return float(mean), float(stddev), float(p50), float(p95), float(p99), int(n)
+    return _baseline_numpy(a)
+
+
+# Compile (or load from cache) at import so the first recalculation isn't slow
+if NUMBA_AVAILABLE:
+    baseline_kernel(np.array([0.0, 1.0]))
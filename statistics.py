@@ -2,30 +2,50 @@
 DriftWatch Statistical Engine
 Distribution-based drift detection using Z-score analysis
 """
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from math import fabs
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List, Dict, Tuple, Optional, Union
 from datetime import datetime
 from config import (
     MIN_SAMPLES_FOR_BASELINE,
     BASELINE_WINDOW_SIZE,
+    BASELINE_RECALC_INTERVAL,
+    BASELINE_WINDOW_CACHE_SIZE,
+    BASELINE_SCALE_CACHE_SECONDS,
     DRIFT_ZSCORE_THRESHOLD,
     DRIFT_CONSECUTIVE_THRESHOLD,
     DRIFT_MODERATE_ZSCORE_THRESHOLD,
     DRIFT_MODERATE_COUNT,
-    DRIFT_MODERATE_WINDOW
+    DRIFT_MODERATE_WINDOW,
+    DRIFT_ADWIN_ENABLED,
+    DRIFT_ADWIN_DELTA,
+    DRIFT_ADWIN_MAX_WINDOW,
+    DRIFT_STATE_CACHE_SIZE
 )
+from stat_kernels import baseline_kernel
+from logging_queue import get_logger
+
+
+log = get_logger("driftwatch.statistics")
 
 
 class StatisticalEngine:
     """Core statistical analysis and drift detection"""
     
+    NORMAL_ZSCORE_THRESHOLD = 2.0  # Recovery threshold (less strict than detection)
+    
     @staticmethod
-    def calculate_baseline(samples: List[float]) -> Dict[str, float]:
+    def calculate_baseline(samples: Union[List[float], np.ndarray]) -> Dict[str, float]:
         """
         Calculate baseline statistics from sample data
         
         Args:
-            samples: List of numerical samples (latency or payload)
+            samples: Numerical samples (latency or payload), list or array
         
         Returns:
             Dictionary with mean, stddev, and percentiles
@@ -33,14 +53,14 @@ class StatisticalEngine:
         if len(samples) < MIN_SAMPLES_FOR_BASELINE:
             raise ValueError(f"Insufficient samples: {len(samples)} < {MIN_SAMPLES_FOR_BASELINE}")
         
-        arr = np.array(samples)
+        mean, stddev, p50, p95, p99, _ = baseline_kernel(samples)
         
         return {
-            'mean': float(np.mean(arr)),
-            'stddev': float(np.std(arr, ddof=1)),  # Sample standard deviation
-            'p50': float(np.percentile(arr, 50)),
-            'p95': float(np.percentile(arr, 95)),
-            'p99': float(np.percentile(arr, 99)),
+            'mean': mean,
+            'stddev': stddev,  # Sample standard deviation
+            'p50': p50,
+            'p95': p95,
+            'p99': p99,
             'sample_count': len(samples)
         }
     
@@ -71,13 +91,15 @@ class StatisticalEngine:
         Returns:
             True if |zscore| > threshold
         """
-        return abs(zscore) > threshold
+        return fabs(zscore) > threshold
     
     @staticmethod
     def detect_drift(
-        recent_zscores: List[float],
+        recent_zscores: Union[List[float], np.ndarray],
         consecutive_threshold: int = DRIFT_CONSECUTIVE_THRESHOLD,
-        moderate_threshold: float = DRIFT_MODERATE_ZSCORE_THRESHOLD
+        moderate_threshold: float = DRIFT_MODERATE_ZSCORE_THRESHOLD,
+        *,
+        _severe: float = DRIFT_ZSCORE_THRESHOLD  # Bound at definition: local lookup per call
     ) -> Tuple[bool, Dict[str, any]]:
         """
         Detect drift using consecutive anomaly analysis
@@ -87,77 +109,156 @@ class StatisticalEngine:
         2. MODERATE: M samples in last K with |z| > 2.5
         
         Args:
-            recent_zscores: List of recent z-scores (ordered newest to oldest)
+            recent_zscores: Recent z-scores (ordered newest to oldest)
             consecutive_threshold: Number of consecutive anomalies to trigger drift
             moderate_threshold: Threshold for moderate anomalies
         
         Returns:
             Tuple of (drift_detected: bool, metadata: dict)
         """
-        if len(recent_zscores) < consecutive_threshold:
-            return False, {'reason': 'insufficient_samples', 'sample_count': len(recent_zscores)}
+        zscores = np.asarray(recent_zscores, dtype=np.float64)
+        abs_zscores = np.abs(zscores)
+        return StatisticalEngine.apply_drift_rules(
+            zscores,
+            abs_zscores > _severe,
+            abs_zscores > moderate_threshold,
+            consecutive_threshold,
+            moderate_threshold
+        )
+    
+    @staticmethod
+    def apply_drift_rules(
+        zscores: np.ndarray,
+        severe: np.ndarray,
+        moderate: np.ndarray,
+        consecutive_threshold: int = DRIFT_CONSECUTIVE_THRESHOLD,
+        moderate_threshold: float = DRIFT_MODERATE_ZSCORE_THRESHOLD,
+        *,
+        # Config bound at definition so the per-event path reads locals
+        _severe: float = DRIFT_ZSCORE_THRESHOLD,
+        _window: int = DRIFT_MODERATE_WINDOW,
+        _count: int = DRIFT_MODERATE_COUNT
+    ) -> Tuple[bool, Dict[str, any]]:
+        """
+        Apply the detect_drift rules to precomputed anomaly masks
+        
+        Args:
+            zscores: Recent z-scores (ordered newest to oldest)
+            severe: |z| > DRIFT_ZSCORE_THRESHOLD for each z-score
+            moderate: |z| > moderate_threshold for each z-score
+        
+        Returns:
+            Tuple of (drift_detected: bool, metadata: dict), as detect_drift
+        """
+        n = len(zscores)
+        if n < consecutive_threshold:
+            return False, {'reason': 'insufficient_samples', 'sample_count': n}
         
         # Rule 1: Consecutive severe anomalies
-        consecutive_count = 0
-        for z in recent_zscores[:consecutive_threshold]:
-            if abs(z) > DRIFT_ZSCORE_THRESHOLD:
-                consecutive_count += 1
-            else:
-                break
+        prefix = severe[:consecutive_threshold]
+        consecutive_count = consecutive_threshold if prefix.all() else int(np.argmin(prefix))
         
         if consecutive_count >= consecutive_threshold:
             return True, {
                 'reason': 'consecutive_severe_anomalies',
                 'consecutive_count': consecutive_count,
-                'threshold': DRIFT_ZSCORE_THRESHOLD,
-                'max_zscore': max(abs(z) for z in recent_zscores[:consecutive_threshold])
+                'threshold': _severe,
+                'max_zscore': float(np.abs(zscores[:consecutive_threshold]).max())
             }
         
         # Rule 2: Moderate anomalies in window
-        if len(recent_zscores) >= DRIFT_MODERATE_WINDOW:
-            window = recent_zscores[:DRIFT_MODERATE_WINDOW]
-            moderate_count = sum(1 for z in window if abs(z) > moderate_threshold)
+        if n >= _window:
+            moderate_count = int(np.count_nonzero(moderate[:_window]))
             
-            if moderate_count >= DRIFT_MODERATE_COUNT:
+            if moderate_count >= _count:
                 return True, {
                     'reason': 'moderate_anomalies_in_window',
                     'moderate_count': moderate_count,
-                    'window_size': DRIFT_MODERATE_WINDOW,
+                    'window_size': _window,
                     'threshold': moderate_threshold
                 }
         
         return False, {
             'reason': 'no_drift',
             'consecutive_count': consecutive_count,
-            'recent_anomalies': sum(1 for z in recent_zscores[:10] if abs(z) > DRIFT_ZSCORE_THRESHOLD)
+            'recent_anomalies': int(np.count_nonzero(severe[:10]))
         }
     
+    @staticmethod
+    def detect_drift_batch(
+        zscores: np.ndarray,
+        consecutive_threshold: int = DRIFT_CONSECUTIVE_THRESHOLD,
+        moderate_threshold: float = DRIFT_MODERATE_ZSCORE_THRESHOLD,
+        *,
+        # Bound at definition, as in apply_drift_rules, so replays use the same rules
+        _severe: float = DRIFT_ZSCORE_THRESHOLD,
+        _window: int = DRIFT_MODERATE_WINDOW,
+        _count: int = DRIFT_MODERATE_COUNT
+    ) -> np.ndarray:
+        """
+        Replay the detect_drift rules over a whole z-score history
+        
+        Every window is a strided view of the anomaly masks, so no
+        per-sample Python work or window copies are needed.
+        
+        Args:
+            zscores: Z-score history (ordered oldest to newest)
+        
+        Returns:
+            Boolean array: element i is True if detect_drift would flag
+            drift with sample i as the newest z-score
+        """
+        abs_zscores = np.abs(np.asarray(zscores, dtype=np.float64))
+        drift = np.zeros(abs_zscores.size, dtype=bool)
+        
+        # Rule 1: the last N samples are all severe
+        if abs_zscores.size >= consecutive_threshold:
+            severe = sliding_window_view(abs_zscores > _severe, consecutive_threshold)
+            drift[consecutive_threshold - 1:] |= severe.all(axis=1)
+        
+        # Rule 2: at least M moderate anomalies in the last K samples
+        if abs_zscores.size >= _window:
+            moderate = sliding_window_view(abs_zscores > moderate_threshold, _window)
+            drift[_window - 1:] |= moderate.sum(axis=1) >= _count
+        
+        return drift
+    
     @staticmethod
     def is_recovered(
-        recent_zscores: List[float],
-        recovery_threshold: int = 50
+        recent_zscores: Union[List[float], np.ndarray],
+        recovery_threshold: int = 50,
+        *,
+        _normal: float = NORMAL_ZSCORE_THRESHOLD  # Bound at definition: local lookup per call
     ) -> bool:
         """
         Determine if service has recovered from drift
         
-        Recovery requires N consecutive normal samples (|z| <= 2.0)
+        Recovery requires N consecutive normal samples (|z| <= NORMAL_ZSCORE_THRESHOLD)
         
         Args:
-            recent_zscores: List of recent z-scores (ordered newest to oldest)
+            recent_zscores: Recent z-scores (ordered newest to oldest)
             recovery_threshold: Number of consecutive normal samples required
         
         Returns:
             True if recovered
         """
-        if len(recent_zscores) < recovery_threshold:
+        window = np.asarray(recent_zscores[:recovery_threshold], dtype=np.float64)
+        return StatisticalEngine.is_recovered_mask(
+            np.abs(window) <= _normal,
+            recovery_threshold
+        )
+    
+    @staticmethod
+    def is_recovered_mask(normal: np.ndarray, recovery_threshold: int = 50) -> bool:
+        """
+        is_recovered over a precomputed mask of |z| <= NORMAL_ZSCORE_THRESHOLD
+        (ordered newest to oldest)
+        """
+        if len(normal) < recovery_threshold:
             return False
         
         # Check last N samples are all normal
-        for z in recent_zscores[:recovery_threshold]:
-            if abs(z) > 2.0:  # Normal threshold (less strict than detection)
-                return False
-        
-        return True
+        return bool(normal[:recovery_threshold].all())
     
     @staticmethod
     def format_baseline_summary(baseline: Dict[str, float]) -> str:
@@ -169,6 +270,334 @@ class StatisticalEngine:
         )
 
 
+class AdaptiveWindow:
+    """
+    ADWIN change detector (Bifet & Gavaldà) over an exponential histogram
+    
+    The window is stored as buckets of (n, mean, M2) whose sizes grow as
+    powers of two, so memory and each cut-point scan are O(log W). When two
+    sub-windows differ in mean by more than the variance-based Hoeffding
+    bound, the older part is dropped and a change is reported.
+    
+    Window totals are kept incrementally, and cut points are only checked
+    every `clock` samples (the ADWIN2 clock), so most updates are O(1).
+    The window never spans more than `max_window` samples, which also
+    bounds the bucket count for a stream that never changes.
+    """
+    
+    def __init__(
+        self,
+        delta: float = DRIFT_ADWIN_DELTA,
+        max_buckets: int = 5,
+        min_window: int = 10,
+        clock: int = 32,
+        max_window: int = DRIFT_ADWIN_MAX_WINDOW
+    ):
+        self.delta = delta
+        self.max_buckets = max_buckets  # Buckets kept per size before merging
+        self.min_window = min_window    # Smallest sub-window considered at a cut
+        self.clock = clock              # Samples between cut-point checks
+        self.max_window = max_window    # Oldest buckets are dropped beyond this width
+        # _levels[i] holds buckets of 2**i samples, oldest first
+        self._levels: List[List[Tuple[int, float, float]]] = []
+        self._total: Tuple[int, float, float] = (0, 0.0, 0.0)  # Whole-window (n, mean, M2)
+        self._ticks = 0
+        self.width = 0
+    
+    @staticmethod
+    def _merge(a: Tuple[int, float, float], b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+        """Combine two (n, mean, M2) buckets (Chan et al.)"""
+        n = a[0] + b[0]
+        delta = b[1] - a[1]
+        return n, a[1] + delta * b[0] / n, a[2] + b[2] + delta * delta * a[0] * b[0] / n
+    
+    @staticmethod
+    def _remove(total: Tuple[int, float, float], b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+        """Take bucket b back out of a merged total (inverse of _merge)"""
+        n = total[0] - b[0]
+        if n <= 0:
+            return 0, 0.0, 0.0
+        mean = (total[0] * total[1] - b[0] * b[1]) / n
+        delta = b[1] - mean
+        return n, mean, max(total[2] - b[2] - delta * delta * n * b[0] / total[0], 0.0)
+    
+    def update(self, value: float) -> bool:
+        """
+        Add a sample and, on clock ticks, test the window for a change in mean
+        
+        Returns:
+            True if a change was detected (older samples were dropped)
+        """
+        if not self._levels:
+            self._levels.append([])
+        self._levels[0].append((1, value, 0.0))
+        self._total = self._merge(self._total, (1, value, 0.0))
+        self.width += 1
+        
+        # Keep at most max_buckets per level by merging the two oldest upward
+        for level in range(len(self._levels)):
+            buckets = self._levels[level]
+            if len(buckets) <= self.max_buckets:
+                break
+            merged = self._merge(buckets.pop(0), buckets.pop(0))
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+            self._levels[level + 1].append(merged)
+        
+        while self.width > self.max_window:
+            self._drop_oldest()
+        
+        self._ticks += 1
+        if self._ticks < self.clock:
+            return False
+        self._ticks = 0
+        
+        changed = False
+        while self.width >= 2 * self.min_window and self._cut_detected():
+            self._drop_oldest()
+            changed = True
+        return changed
+    
+    @property
+    def mean(self) -> float:
+        """Mean of the samples currently in the window"""
+        return self._total[1]
+    
+    def rescale(self, scale: float, shift: float):
+        """Map every sample x in the window to scale * x + shift"""
+        def transform(bucket: Tuple[int, float, float]) -> Tuple[int, float, float]:
+            n, mean, m2 = bucket
+            return n, scale * mean + shift, scale * scale * m2
+        
+        self._levels = [[transform(bucket) for bucket in level] for level in self._levels]
+        self._total = transform(self._total)
+    
+    def _cut_detected(self) -> bool:
+        """Check every bucket boundary against the Hoeffding bound in one pass"""
+        n, mean, m2 = self._total
+        variance = m2 / n
+        log_term = math.log(2 * math.log(n) / self.delta)
+        min_window = self.min_window
+        
+        # Prefix (older sub-window) count and sum, oldest bucket first
+        n0 = 0
+        sum0 = 0.0
+        for level in reversed(self._levels):
+            for count, bucket_mean, _ in level:
+                n0 += count
+                sum0 += count * bucket_mean
+                n1 = n - n0
+                if n1 < min_window:
+                    return False
+                if n0 < min_window:
+                    continue
+                mean0 = sum0 / n0
+                mean1 = (n * mean - sum0) / n1
+                m = 1 / (n0 - min_window + 1) + 1 / (n1 - min_window + 1)
+                epsilon = math.sqrt(2 * m * variance * log_term) + 2 / 3 * log_term * m
+                if fabs(mean0 - mean1) > epsilon:
+                    return True
+        return False
+    
+    def _drop_oldest(self):
+        """Remove the oldest bucket from the window"""
+        oldest = self._levels[-1].pop(0)
+        self._total = self._remove(self._total, oldest)
+        self.width -= oldest[0]
+        if not self._levels[-1]:
+            self._levels.pop()
+
+
+class ZScoreRing:
+    """
+    Most recent z-scores of one stream, newest first, with anomaly masks
+    
+    The severe/moderate/normal masks used by the drift and recovery rules
+    are shifted along with the values, so each new sample costs a handful
+    of comparisons instead of re-deriving the masks over the whole window.
+    """
+    
+    def __init__(self, capacity: int, recent_zscores: np.ndarray):
+        self.zscores = np.zeros(capacity, dtype=np.float32)  # Only read back for metadata
+        self.severe = np.zeros(capacity, dtype=bool)
+        self.moderate = np.zeros(capacity, dtype=bool)
+        self.normal = np.zeros(capacity, dtype=bool)
+        
+        self.filled = min(len(recent_zscores), capacity)
+        recent = np.abs(recent_zscores[:self.filled])
+        self.zscores[:self.filled] = recent_zscores[:self.filled]
+        self.severe[:self.filled] = recent > DRIFT_ZSCORE_THRESHOLD
+        self.moderate[:self.filled] = recent > DRIFT_MODERATE_ZSCORE_THRESHOLD
+        self.normal[:self.filled] = recent <= StatisticalEngine.NORMAL_ZSCORE_THRESHOLD
+    
+    def push(self, zscore: float):
+        """Add the newest z-score, dropping the oldest when full"""
+        magnitude = fabs(zscore)
+        for values, value in (
+            (self.zscores, zscore),
+            (self.severe, magnitude > DRIFT_ZSCORE_THRESHOLD),
+            (self.moderate, magnitude > DRIFT_MODERATE_ZSCORE_THRESHOLD),
+            (self.normal, magnitude <= StatisticalEngine.NORMAL_ZSCORE_THRESHOLD)
+        ):
+            values[1:] = values[:-1]
+            values[0] = value
+        self.filled = min(self.filled + 1, len(self.zscores))
+
+
+class SortedWindow:
+    """
+    The most recent samples of one metric, kept in arrival and sorted order
+    
+    A ring buffer records arrival order for eviction; a parallel buffer is
+    kept sorted by binary search and an in-place shift on every insert, so
+    percentiles are read by index instead of sorting the window on each
+    baseline recalculation. Mean and variance are maintained with Welford's
+    update (rolling variant once full: the evicted sample is replaced);
+    add_many applies a whole batch of samples at once.
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._ring = np.empty(capacity)     # Arrival order
+        self._sorted = np.empty(capacity)   # First `size` entries ascending
+        self._next = 0                      # Ring slot for the next sample
+        self.size = 0
+        self._mean = 0.0
+        self._m2 = 0.0                      # Sum of squared deviations from the mean
+    
+    @classmethod
+    def from_samples(cls, capacity: int, samples: np.ndarray) -> 'SortedWindow':
+        """
+        Build a window from existing samples with one sort
+        
+        Args:
+            capacity: Window capacity
+            samples: Up to `capacity` samples, ordered oldest to newest
+        """
+        window = cls(capacity)
+        window._load(samples)
+        return window
+    
+    def _load(self, samples: np.ndarray):
+        """Replace the window's contents with `samples` (oldest first)"""
+        n = len(samples)
+        self._ring[:n] = samples
+        self._sorted[:n] = np.sort(samples)
+        self._next = n % self.capacity
+        self.size = n
+        self._mean = 0.0
+        self._m2 = 0.0
+        
+        if n >= 2:
+            mean, stddev, _, _, _, _ = baseline_kernel(samples)
+            self._mean = mean
+            self._m2 = stddev * stddev * (n - 1)
+        elif n == 1:
+            self._mean = float(samples[0])
+    
+    def add(self, value: float):
+        """Add a sample, evicting the oldest when the window is full"""
+        ordered = self._sorted
+        n = self.size
+        if n == self.capacity:
+            old = float(self._ring[self._next])
+            i = int(np.searchsorted(ordered[:n], old))
+            ordered[i:n - 1] = ordered[i + 1:n]
+            n -= 1
+            
+            # Replace the evicted sample's contribution in one step
+            mean = self._mean + (value - old) / self.capacity
+            self._m2 = max(self._m2 + (value - old) * (value - mean + old - self._mean), 0.0)
+            self._mean = mean
+        else:
+            delta = value - self._mean
+            self._mean += delta / (n + 1)
+            self._m2 += delta * (value - self._mean)
+        
+        j = int(np.searchsorted(ordered[:n], value))
+        ordered[j + 1:n + 1] = ordered[j:n]
+        ordered[j] = value
+        
+        self._ring[self._next] = value
+        self._next = (self._next + 1) % self.capacity
+        self.size = n + 1
+    
+    def add_many(self, values: np.ndarray):
+        """
+        Add samples (oldest first) in one vectorized step
+        
+        The evicted samples are deleted from and the new ones merged into
+        the sorted buffer with one searchsorted each, and the moments are
+        updated by removing and merging whole groups (Chan et al.).
+        """
+        k = len(values)
+        if k == 1:
+            self.add(float(values[0]))
+            return
+        if k == 0:
+            return
+        
+        capacity = self.capacity
+        n = self.size
+        if n == 0 or k >= capacity:
+            self._load(values[-capacity:])
+            return
+        
+        # Oldest samples pushed out by the new ones
+        evicted_count = max(n + k - capacity, 0)
+        ordered = self._sorted[:n]
+        if evicted_count:
+            oldest = (self._next - n) % capacity
+            evicted = np.sort(self._ring[(oldest + np.arange(evicted_count)) % capacity])
+            
+            # Equal values sit in consecutive slots: offset each by its rank among equals
+            ranks = np.arange(evicted_count) - np.searchsorted(evicted, evicted)
+            ordered = np.delete(ordered, np.searchsorted(ordered, evicted) + ranks)
+            
+            remaining = n - evicted_count
+            evicted_mean = float(evicted.mean())
+            mean = (n * self._mean - evicted_count * evicted_mean) / remaining
+            delta = evicted_mean - mean
+            self._m2 = max(
+                self._m2 - float(np.sum((evicted - evicted_mean) ** 2))
+                - delta * delta * evicted_count * remaining / n,
+                0.0
+            )
+            self._mean = mean
+            n = remaining
+        
+        added = np.sort(values)
+        new_size = n + k
+        self._sorted[:new_size] = np.insert(ordered, np.searchsorted(ordered, added), added)
+        
+        added_mean = float(added.mean())
+        delta = added_mean - self._mean
+        self._m2 = float(self._m2 + np.sum((added - added_mean) ** 2) + delta * delta * n * k / new_size)
+        self._mean = float(self._mean + delta * k / new_size)
+        
+        self._ring[(self._next + np.arange(k)) % capacity] = values
+        self._next = (self._next + k) % capacity
+        self.size = new_size
+    
+    def summary(self) -> Dict[str, float]:
+        """Baseline statistics of the window, as StatisticalEngine.calculate_baseline"""
+        n = self.size
+        samples = self._sorted[:n]
+        position = np.array([0.50, 0.95, 0.99]) * (n - 1)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, n - 1)
+        p50, p95, p99 = samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+        
+        return {
+            'mean': self._mean,
+            'stddev': math.sqrt(self._m2 / (n - 1)),  # Sample standard deviation
+            'p50': float(p50),
+            'p95': float(p95),
+            'p99': float(p99),
+            'sample_count': n
+        }
+
+
 class BaselineManager:
     """
     Manages baseline calculation and updates for services
@@ -177,21 +606,90 @@ class BaselineManager:
     def __init__(self, db):
         self.db = db
         self.engine = StatisticalEngine()
+        
+        # service_id -> (latency, payload) windows fed by observe(); seeded
+        # from telemetry on first recalculation, evicted least recently used
+        self._windows: OrderedDict[str, Tuple[SortedWindow, SortedWindow]] = OrderedDict()
+    
+    def observe_many(
+        self,
+        service_id: str,
+        latencies: Union[List[float], np.ndarray],
+        payloads: Union[List[float], np.ndarray]
+    ):
+        """Add persisted samples (oldest first) to the service's baseline windows, if held"""
+        windows = self._windows.get(service_id)
+        if windows is not None:
+            windows[0].add_many(np.asarray(latencies, dtype=np.float64))
+            windows[1].add_many(np.asarray(payloads, dtype=np.float64))
+    
+    async def _get_windows(self, service_id: str) -> Tuple[SortedWindow, SortedWindow]:
+        """Baseline windows for a service, loading recent telemetry on a miss"""
+        windows = self._windows.get(service_id)
+        if windows is not None:
+            self._windows.move_to_end(service_id)
+            return windows
+        
+        latencies, payloads = await self.db.get_recent_metrics(
+            service_id, 
+            limit=BASELINE_WINDOW_SIZE
+        )
+        return self._seed_windows(service_id, latencies, payloads)
+    
+    async def _get_windows_many(self, service_ids: List[str]) -> Dict[str, Tuple[SortedWindow, SortedWindow]]:
+        """_get_windows for several services; all misses are loaded with one query"""
+        windows = {}
+        missing = []
+        for service_id in service_ids:
+            held = self._windows.get(service_id)
+            if held is None:
+                missing.append(service_id)
+            else:
+                self._windows.move_to_end(service_id)
+                windows[service_id] = held
+        
+        if missing:
+            empty = (np.empty(0), np.empty(0))
+            metrics = await self.db.get_recent_metrics_many(missing, limit=BASELINE_WINDOW_SIZE)
+            for service_id in missing:
+                windows[service_id] = self._seed_windows(
+                    service_id, *metrics.get(service_id, empty)
+                )
+        return windows
+    
+    def _seed_windows(
+        self,
+        service_id: str,
+        latencies: np.ndarray,
+        payloads: np.ndarray
+    ) -> Tuple[SortedWindow, SortedWindow]:
+        """Build and hold a service's windows from recent metrics (newest first)"""
+        windows = (
+            SortedWindow.from_samples(BASELINE_WINDOW_SIZE, latencies[::-1]),
+            SortedWindow.from_samples(BASELINE_WINDOW_SIZE, payloads[::-1])
+        )
+        
+        self._windows[service_id] = windows
+        if len(self._windows) > BASELINE_WINDOW_CACHE_SIZE:
+            self._windows.popitem(last=False)
+        return windows
     
     async def should_recalculate(self, service_id: str) -> bool:
         """
         Determine if baseline should be recalculated
         
         Recalculate when:
-        - No baseline exists
+        - No baseline exists and enough samples have been collected
         - New samples collected since last calculation exceeds threshold
+        
+        The baseline row's running count is advanced by every insert, so
+        no COUNT(*) over telemetry is needed once a baseline exists.
         """
         baseline = await self.db.get_baseline(service_id)
         if not baseline:
-            return True
+            return await self.db.get_telemetry_count(service_id) >= MIN_SAMPLES_FOR_BASELINE
         
-        current_count = await self.db.get_telemetry_count(service_id)
-        return current_count >= baseline['sample_count'] + 50  # BASELINE_RECALC_INTERVAL
+        return baseline['n'] >= baseline['sample_count'] + BASELINE_RECALC_INTERVAL
     
     async def calculate_and_store(self, service_id: str) -> Optional[Dict[str, float]]:
         """
@@ -200,27 +698,20 @@ class BaselineManager:
         Returns:
             Baseline statistics or None if insufficient data
         """
-        # Get recent telemetry
-        telemetry = await self.db.get_recent_telemetry(
-            service_id, 
-            limit=BASELINE_WINDOW_SIZE
-        )
+        # Get recent metrics (kept sorted in memory as samples arrive)
+        latency_window, payload_window = await self._get_windows(service_id)
         
-        if len(telemetry) < MIN_SAMPLES_FOR_BASELINE:
+        if latency_window.size < MIN_SAMPLES_FOR_BASELINE:
             return None
         
-        # Extract metrics
-        latencies = [record['latency_ms'] for record in telemetry]
-        payloads = [record['payload_kb'] for record in telemetry]
-        
         # Calculate baselines
-        latency_baseline = self.engine.calculate_baseline(latencies)
-        payload_baseline = self.engine.calculate_baseline(payloads)
+        latency_baseline = latency_window.summary()
+        payload_baseline = payload_window.summary()
         
         # Store in database
         await self.db.upsert_baseline(
             service_id=service_id,
-            sample_count=len(telemetry),
+            sample_count=latency_baseline['sample_count'],
             mean_latency=latency_baseline['mean'],
             stddev_latency=latency_baseline['stddev'],
             mean_payload=payload_baseline['mean'],
@@ -237,6 +728,49 @@ class BaselineManager:
             'latency': latency_baseline,
             'payload': payload_baseline
         }
+    
+    async def calculate_and_store_many(self, service_ids: List[str]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Recalculate baselines for many services in one pass
+        
+        Windows not yet held in memory are loaded with one query, and all
+        results are stored with one batched upsert. Services with fewer
+        than MIN_SAMPLES_FOR_BASELINE samples are skipped.
+        
+        Returns:
+            Mapping of service_id to {'latency': ..., 'payload': ...} baselines
+            (its keys are the services whose baseline changed)
+        """
+        results = {}
+        for service_id, (latency_window, payload_window) in (
+            await self._get_windows_many(service_ids)
+        ).items():
+            if latency_window.size >= MIN_SAMPLES_FOR_BASELINE:
+                results[service_id] = {
+                    'latency': latency_window.summary(),
+                    'payload': payload_window.summary()
+                }
+        if not results:
+            return {}
+        
+        await self.db.upsert_baselines([
+            {
+                'service_id': service_id,
+                'sample_count': baseline['latency']['sample_count'],
+                'mean_latency': baseline['latency']['mean'],
+                'stddev_latency': baseline['latency']['stddev'],
+                'mean_payload': baseline['payload']['mean'],
+                'stddev_payload': baseline['payload']['stddev'],
+                'p50_latency': baseline['latency']['p50'],
+                'p95_latency': baseline['latency']['p95'],
+                'p99_latency': baseline['latency']['p99']
+            }
+            for service_id, baseline in results.items()
+        ])
+        
+        print(f"✓ Baselines updated for {len(results)} services")
+        
+        return results
 
 
 class DriftDetector:
@@ -244,9 +778,28 @@ class DriftDetector:
     Detects drift by comparing recent samples against baseline
     """
     
+    ZSCORE_CACHE_SIZE = 60       # Covers the drift (25) and recovery (60) windows
+    ZSCORE_FLUSH_ROWS = 50       # Persist buffered z-scores once this many are pending
+    ZSCORE_FLUSH_SECONDS = 0.2   # ... or this long after the first one was buffered
+    ZSCORE_PENDING_MAX = 10000   # Rows kept for retry while the database rejects writes
+    
     def __init__(self, db):
         self.db = db
         self.engine = StatisticalEngine()
+        self._windows: Dict[str, AdaptiveWindow] = {}  # Per-service ADWIN state
+        self._calm_samples: Dict[str, int] = {}  # Samples since the last |z| > moderate threshold
+        self._zscore_cache: Dict[str, ZScoreRing] = {}  # Per-service recent latency z-scores
+        # Per-service (expires_at, mean_latency, 1/stddev_latency, mean_payload, 1/stddev_payload);
+        # expired by baseline_changed(), expiry covers baselines written elsewhere
+        self._scales: Dict[str, Tuple[float, float, float, float, float]] = {}
+        # Recency of the services above; the least recently used one's state
+        # is evicted from all of them together
+        self._services: OrderedDict[str, None] = OrderedDict()
+        
+        # Write-behind buffer for zscore_history; detection reads the rings
+        self._pending_zscores: List[Tuple[str, datetime, float, float]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def evaluate(
         self, 
@@ -267,38 +820,78 @@ class DriftDetector:
         Returns:
             Tuple of (drift_detected: bool, metadata: dict)
         """
-        # Get baseline
-        baseline = await self.db.get_baseline(service_id)
-        if not baseline:
-            return False, {'reason': 'no_baseline'}
-        
-        # Calculate z-scores
-        latency_zscore = self.engine.calculate_zscore(
-            latency_ms,
-            baseline['mean_latency'],
-            baseline['stddev_latency']
-        )
-        
-        payload_zscore = self.engine.calculate_zscore(
-            payload_kb,
-            baseline['mean_payload'],
-            baseline['stddev_payload']
-        )
-        
-        # Store z-scores
-        await self.db.insert_zscore(
-            service_id=service_id,
-            timestamp=timestamp,
-            latency_zscore=latency_zscore,
-            payload_zscore=payload_zscore
-        )
-        
-        # Get recent z-scores for drift detection
-        recent_zscores = await self.db.get_recent_zscores(service_id, limit=25)
-        latency_zscores = [record['latency_zscore'] for record in recent_zscores]
-        
-        # Detect drift (focus on latency for MVP)
-        drift_detected, metadata = self.engine.detect_drift(latency_zscores)
+        self._touch(service_id)
+        
+        # Get baseline scaling
+        scales = self._scales.get(service_id)
+        now = time.monotonic()
+        if scales is None or scales[0] <= now:
+            baseline = await self.db.get_baseline(service_id)
+            if not baseline:
+                return False, {'reason': 'no_baseline'}
+            previous = scales
+            scales = self._scales[service_id] = (
+                now + BASELINE_SCALE_CACHE_SECONDS,
+                baseline['mean_latency'], self._inverse(baseline['stddev_latency']),
+                baseline['mean_payload'], self._inverse(baseline['stddev_payload'])
+            )
+            if previous is not None:
+                self._rescale_window(service_id, previous, scales)
+        _, mean_latency, inv_latency, mean_payload, inv_payload = scales
+        
+        # Calculate z-scores (calculate_zscore with the division hoisted out)
+        latency_zscore = (latency_ms - mean_latency) * inv_latency
+        payload_zscore = (payload_kb - mean_payload) * inv_payload
+        
+        ring = await self._record_zscore(service_id, latency_zscore)
+        
+        # Store z-scores (buffered; written in batches)
+        self._pending_zscores.append((service_id, timestamp, latency_zscore, payload_zscore))
+        if len(self._pending_zscores) >= self.ZSCORE_FLUSH_ROWS:
+            await self.flush_zscores()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self.ZSCORE_FLUSH_SECONDS, self._start_timed_flush
+            )
+        
+        # Cheap pre-check: neither threshold rule can fire without a moderate
+        # anomaly in the last window, so the rule scan is skipped until one
+        # appears (the skipped scan's result is known exactly)
+        if fabs(latency_zscore) > DRIFT_MODERATE_ZSCORE_THRESHOLD:
+            calm = 0
+        else:
+            calm = self._calm_samples.get(service_id, 0) + 1
+        self._calm_samples[service_id] = calm
+        
+        if calm >= DRIFT_MODERATE_WINDOW:
+            drift_detected, metadata = False, {
+                'reason': 'no_drift',
+                'consecutive_count': 0,
+                'recent_anomalies': 0
+            }
+        else:
+            # Detect drift (focus on latency for MVP)
+            window = min(ring.filled, 25)
+            drift_detected, metadata = self.engine.apply_drift_rules(
+                ring.zscores[:window], ring.severe[:window], ring.moderate[:window]
+            )
+        
+        # Adaptive window catches sustained shifts the fixed thresholds miss;
+        # only shifts away from the baseline count (not the return to it)
+        if DRIFT_ADWIN_ENABLED:
+            window = self._windows.get(service_id)
+            if window is None:
+                window = self._windows[service_id] = AdaptiveWindow()
+            previous_mean = window.mean
+            if (window.update(latency_zscore)
+                    and fabs(window.mean) > fabs(previous_mean)
+                    and not drift_detected):
+                drift_detected = True
+                metadata = {
+                    'reason': 'adaptive_window_change',
+                    'window_size': window.width,
+                    'delta': window.delta
+                }
         
         metadata.update({
             'current_latency_zscore': latency_zscore,
@@ -307,6 +900,55 @@ class DriftDetector:
         
         return drift_detected, metadata
     
+    @staticmethod
+    def _inverse(stddev: float) -> float:
+        """Reciprocal of a baseline stddev; zero variance gives z = 0 as in calculate_zscore"""
+        return 1.0 / stddev if stddev else 0.0
+    
+    def _touch(self, service_id: str):
+        """Mark a service as recently used, evicting the least recently used one's state"""
+        services = self._services
+        if service_id in services:
+            services.move_to_end(service_id)
+            return
+        
+        services[service_id] = None
+        if len(services) > DRIFT_STATE_CACHE_SIZE:
+            evicted, _ = services.popitem(last=False)
+            for state in (self._windows, self._calm_samples, self._zscore_cache, self._scales):
+                state.pop(evicted, None)
+    
+    def baseline_changed(self, service_id: str):
+        """Expire cached baseline scaling after a recalculation"""
+        scales = self._scales.get(service_id)
+        if scales is not None:
+            # Kept (expired) so the next evaluate can rescale the ADWIN window
+            self._scales[service_id] = (0.0,) + scales[1:]
+    
+    def _rescale_window(
+        self,
+        service_id: str,
+        previous: Tuple[float, float, float, float, float],
+        scales: Tuple[float, float, float, float, float]
+    ):
+        """
+        Re-express a service's ADWIN window in the new baseline's z-scores
+        
+        Otherwise a recalculated baseline looks like a step change in the
+        z-score stream even when the latencies themselves are stationary.
+        """
+        window = self._windows.get(service_id)
+        if window is None:
+            return
+        
+        _, old_mean, old_inv, _, _ = previous
+        _, new_mean, new_inv, _, _ = scales
+        if old_inv == 0.0:
+            # Zero-variance baseline: every z was 0, the latencies can't be recovered
+            del self._windows[service_id]
+        elif old_mean != new_mean or old_inv != new_inv:
+            window.rescale(new_inv / old_inv, (old_mean - new_mean) * new_inv)
+    
     async def check_recovery(self, service_id: str) -> bool:
         """
         Check if service has recovered from drift state
@@ -314,7 +956,65 @@ class DriftDetector:
         Returns:
             True if recovered (50 consecutive normal samples)
         """
-        recent_zscores = await self.db.get_recent_zscores(service_id, limit=60)
-        latency_zscores = [record['latency_zscore'] for record in recent_zscores]
+        self._touch(service_id)
+        ring = self._zscore_cache.get(service_id)
+        if ring is None:
+            ring = await self._load_zscores(service_id)
+        
+        return self.engine.is_recovered_mask(ring.normal[:ring.filled])
+    
+    async def flush_zscores(self):
+        """Write all buffered z-scores to zscore_history"""
+        # Let an in-flight timed flush finish first so batches land in order
+        task = self._flush_task
+        if task is not None and task is not asyncio.current_task() and not task.done():
+            await task
+        
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        
+        pending, self._pending_zscores = self._pending_zscores, []
+        if not pending:
+            return
+        
+        try:
+            await self.db.insert_zscore_batch(pending)
+        except Exception as e:
+            # Put the rows back ahead of newer ones; the next flush retries them
+            self._pending_zscores[:0] = pending
+            overflow = len(self._pending_zscores) - self.ZSCORE_PENDING_MAX
+            if overflow > 0:
+                del self._pending_zscores[:overflow]
+                log.error(f"✗ Dropped {overflow} oldest unpersisted z-scores")
+            log.error(f"✗ Failed to persist {len(pending)} z-scores (kept for retry): {e}")
+    
+    def _start_timed_flush(self):
+        """Timer callback: flush buffered z-scores in the background"""
+        self._flush_timer = None
+        self._flush_task = asyncio.create_task(self.flush_zscores())
+    
+    async def _load_zscores(self, service_id: str) -> ZScoreRing:
+        """Fill the z-score cache for a service from history (cold start)"""
+        recent_zscores = await self.db.get_recent_zscores(service_id, limit=self.ZSCORE_CACHE_SIZE)
+        ring = ZScoreRing(self.ZSCORE_CACHE_SIZE, np.fromiter(
+            (record['latency_zscore'] for record in recent_zscores),
+            dtype=np.float64,
+            count=len(recent_zscores)
+        ))
+        self._zscore_cache[service_id] = ring
+        return ring
+    
+    async def _record_zscore(self, service_id: str, latency_zscore: float) -> ZScoreRing:
+        """
+        Push a new latency z-score into the cache
+        
+        Returns:
+            The service's z-score ring
+        """
+        ring = self._zscore_cache.get(service_id)
+        if ring is None:
+            ring = await self._load_zscores(service_id)
         
-        return self.engine.is_recovered(latency_zscores)
\ No newline at end of file
+        ring.push(latency_zscore)
+        return ring
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+API tests through FastAPI's TestClient against an in-memory database
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from database import db
+from main import app
+
+
+class TelemetryBatchTests(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        # One app lifespan for the class: the shared Database binds to its event loop
+        db.db_path = ':memory:'
+        cls.client = TestClient(app)
+        cls.client.__enter__()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.__exit__(None, None, None)
+    
+    def test_mixed_batch_reports_rejected_items_by_index(self):
+        stale = (datetime.now(timezone.utc) - timedelta(hours=3)).isoformat()
+        items = [
+            {"service_id": "checkout", "latency_ms": 120.0, "payload_kb": 2.0},
+            {"service_id": "checkout", "latency_ms": 400000.0, "payload_kb": 2.0},
+            {"service_id": "checkout", "latency_ms": 118.5, "payload_kb": 2.1},
+            {"service_id": "checkout", "latency_ms": 121.0, "payload_kb": 2.0, "timestamp": stale}
+        ]
+        
+        response = self.client.post("/v1/telemetry/batch", json={"items": items})
+        
+        self.assertEqual(response.status_code, 202)
+        body = response.json()
+        self.assertEqual(body['status'], 'accepted')
+        self.assertEqual(body['accepted'], 2)
+        self.assertEqual(body['rejected'], 2)
+        self.assertEqual([error['index'] for error in body['errors']], [1, 3])
+        self.assertIn('Latency exceeds', body['errors'][0]['detail'])
+        self.assertTrue(body['message'])
+    
+    def test_schema_violation_rejects_whole_batch(self):
+        items = [{"service_id": "checkout", "latency_ms": -1.0, "payload_kb": 2.0}]
+        
+        response = self.client.post("/v1/telemetry/batch", json={"items": items})
+        
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == '__main__':
+    unittest.main()
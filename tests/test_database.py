@@ -0,0 +1,83 @@
+"""
+Database read cache tests against an in-memory SQLite database
+"""
+
+import unittest
+from datetime import datetime, timezone
+
+from database import Database, _ReadCache
+
+
+class ReadCacheTests(unittest.TestCase):
+    
+    def test_write_rejects_read_started_before_it(self):
+        cache = _ReadCache(ttl_seconds=60.0)
+        version = cache.version
+        
+        cache.invalidate('svc')
+        cache.put('svc', {'mean_latency': 100.0}, version)
+        
+        self.assertGreater(cache.version, version)
+        self.assertIs(cache.get('svc'), _ReadCache.MISS)
+    
+    def test_update_patches_cached_row(self):
+        cache = _ReadCache(ttl_seconds=60.0)
+        cache.put('svc', {'n': 100, 'mean_latency': 100.0}, cache.version)
+        version = cache.version
+        
+        cache.update('svc', {'n': 101})
+        
+        self.assertEqual(cache.get('svc'), {'n': 101, 'mean_latency': 100.0})
+        self.assertGreater(cache.version, version)
+    
+    def test_entries_expire(self):
+        cache = _ReadCache(ttl_seconds=-1.0)
+        cache.put('svc', {'n': 1}, cache.version)
+        self.assertIs(cache.get('svc'), _ReadCache.MISS)
+
+
+class DatabaseCacheTests(unittest.IsolatedAsyncioTestCase):
+    
+    async def asyncSetUp(self):
+        self.db = Database(':memory:')
+        await self.db.connect()
+    
+    async def asyncTearDown(self):
+        await self.db.close()
+    
+    async def upsert(self, mean_latency: float):
+        await self.db.upsert_baseline('svc', 100, mean_latency, 10.0, 1.0, 0.1)
+    
+    async def test_baseline_write_bumps_version_and_next_read_misses(self):
+        await self.upsert(100.0)
+        self.assertEqual((await self.db.get_baseline('svc'))['mean_latency'], 100.0)
+        version = self.db._baseline_cache.version
+        
+        await self.upsert(120.0)
+        
+        self.assertGreater(self.db._baseline_cache.version, version)
+        self.assertIs(self.db._baseline_cache.get('svc'), _ReadCache.MISS)
+        self.assertEqual((await self.db.get_baseline('svc'))['mean_latency'], 120.0)
+    
+    async def test_insert_advances_cached_baseline_count(self):
+        await self.upsert(100.0)
+        await self.db.get_baseline('svc')
+        
+        await self.db.insert_telemetry('svc', datetime.now(timezone.utc), 100.0, 1.0)
+        
+        self.assertEqual(self.db._baseline_cache.get('svc')['n'], 101)
+        self.assertEqual((await self.db.get_baseline('svc'))['n'], 101)
+    
+    async def test_health_write_bumps_version_and_next_read_misses(self):
+        await self.db.upsert_health_state('svc', 'STABLE')
+        self.assertEqual((await self.db.get_health_state('svc'))['state'], 'STABLE')
+        version = self.db._health_cache.version
+        
+        await self.db.upsert_health_state('svc', 'DRIFT_DETECTED')
+        
+        self.assertGreater(self.db._health_cache.version, version)
+        self.assertEqual((await self.db.get_health_state('svc'))['state'], 'DRIFT_DETECTED')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+DriftDetector tests against an in-memory stand-in for the database
+"""
+
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import numpy as np
+
+import statistics as driftwatch_statistics
+from statistics import AdaptiveWindow, DriftDetector
+
+
+class FakeDatabase:
+    """Just the calls DriftDetector makes, with call counts"""
+    
+    def __init__(self, mean: float = 100.0, stddev: float = 10.0):
+        self.baseline = {
+            'mean_latency': mean, 'stddev_latency': stddev,
+            'mean_payload': 1.0, 'stddev_payload': 1.0
+        }
+        self.zscore_reads = 0
+        self.zscore_rows = []
+    
+    async def get_baseline(self, service_id):
+        return dict(self.baseline)
+    
+    async def get_recent_zscores(self, service_id, limit=100):
+        self.zscore_reads += 1
+        return []
+    
+    async def insert_zscore_batch(self, rows):
+        self.zscore_rows.extend(rows)
+
+
+class DriftDetectorTestCase(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        self.db = FakeDatabase()
+        self.detector = DriftDetector(self.db)
+        self.now = datetime.now(timezone.utc)
+    
+    async def asyncTearDown(self):
+        await self.detector.flush_zscores()
+    
+    async def feed(self, latencies, service_id='svc'):
+        """Evaluate each latency in turn, returning the decisions"""
+        return [
+            await self.detector.evaluate(service_id, latency, 1.0, self.now)
+            for latency in latencies
+        ]
+
+
+@mock.patch.object(driftwatch_statistics, 'DRIFT_ADWIN_ENABLED', False)
+class CalmPreCheckTests(DriftDetectorTestCase):
+    
+    async def test_rule_scan_skipped_once_calm(self):
+        rules = self.detector.engine.apply_drift_rules
+        with mock.patch.object(self.detector.engine, 'apply_drift_rules', wraps=rules) as spy:
+            await self.feed([100.0] * 100)
+        
+        # Only the samples before a full moderate window of calm are scanned
+        self.assertEqual(spy.call_count, driftwatch_statistics.DRIFT_MODERATE_WINDOW - 1)
+        # The z-score history is read once on cold start, then served from the ring
+        self.assertEqual(self.db.zscore_reads, 1)
+    
+    async def test_skip_matches_full_scan(self):
+        latencies = [100.0] * 40 + [130.0, 135.0, 128.0] + [100.0] * 40 + [140.0] * 6
+        decisions = await self.feed(latencies)
+        
+        zscores = [(latency - 100.0) / 10.0 for latency in latencies]
+        for i, (drift_detected, metadata) in enumerate(decisions):
+            expected, expected_metadata = self.detector.engine.detect_drift(zscores[i::-1][:25])
+            self.assertEqual(drift_detected, expected)
+            self.assertEqual(metadata['reason'], expected_metadata['reason'])
+        self.assertTrue(decisions[-1][0])
+    
+    async def test_batch_replay_matches_live_decisions(self):
+        rng = np.random.default_rng(11)
+        latencies = np.concatenate([
+            rng.normal(100.0, 10.0, 200),
+            rng.normal(128.0, 4.0, 40),     # Moderate: trips the window count rule
+            rng.normal(100.0, 10.0, 100),
+            rng.normal(160.0, 5.0, 20),     # Severe: trips the consecutive rule
+            rng.normal(100.0, 10.0, 100)
+        ])
+        decisions = await self.feed(latencies)
+        
+        live = np.array([drift_detected for drift_detected, _ in decisions])
+        replay = self.detector.engine.detect_drift_batch((latencies - 100.0) / 10.0)
+        self.assertTrue(live.any())
+        np.testing.assert_array_equal(replay, live)
+    
+    async def test_moderate_anomaly_resumes_scan(self):
+        await self.feed([100.0] * 40)
+        rules = self.detector.engine.apply_drift_rules
+        with mock.patch.object(self.detector.engine, 'apply_drift_rules', wraps=rules) as spy:
+            await self.feed([130.0])
+        
+        spy.assert_called_once()
+
+
+
+@mock.patch.object(driftwatch_statistics, 'DRIFT_ADWIN_ENABLED', True)
+class AdaptiveWindowTests(DriftDetectorTestCase):
+    
+    async def test_stationary_stream_across_recalculation(self):
+        rng = np.random.default_rng(7)
+        decisions = await self.feed(rng.normal(100.0, 10.0, 600))
+        
+        # A recalculated baseline shifts every z-score; the latencies don't move
+        self.db.baseline.update(mean_latency=108.0, stddev_latency=12.0)
+        self.detector.baseline_changed('svc')
+        decisions += await self.feed(rng.normal(100.0, 10.0, 600))
+        
+        reasons = [metadata['reason'] for _, metadata in decisions]
+        self.assertEqual(reasons.count('adaptive_window_change'), 0)
+        # The window was carried over into the new z-scores, not discarded
+        self.assertEqual(self.detector._windows['svc'].width, 1200)
+    
+    def test_rescale_matches_transformed_stream(self):
+        values = np.random.default_rng(3).normal(0.0, 1.0, 500)
+        window, expected = AdaptiveWindow(), AdaptiveWindow()
+        for value in values:
+            window.update(value)
+            expected.update(0.8 * value - 0.5)
+        
+        window.rescale(0.8, -0.5)
+        self.assertAlmostEqual(window.mean, expected.mean)
+        self.assertAlmostEqual(window._total[2], expected._total[2])
+    
+    def test_window_width_is_capped(self):
+        window = AdaptiveWindow(max_window=1000)
+        for value in np.random.default_rng(5).normal(0.0, 1.0, 5000):
+            window.update(value)
+        
+        self.assertLessEqual(window.width, 1000)
+        self.assertLessEqual(sum(len(level) for level in window._levels), 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+SortedWindow tests against numpy over the same trailing samples
+(sorted order, percentiles and the rolling mean/stddev)
+"""
+
+import unittest
+
+import numpy as np
+
+from statistics import SortedWindow
+
+
+class SortedWindowTests(unittest.TestCase):
+    
+    CAPACITY = 100
+    
+    def setUp(self):
+        # Rounded so the window holds many equal values
+        self.samples = np.round(np.random.default_rng(42).normal(150.0, 25.0, 1000))
+    
+    def assertMatchesNumpy(self, window: SortedWindow, seen: np.ndarray):
+        expected = seen[-self.CAPACITY:]
+        np.testing.assert_array_equal(window._sorted[:window.size], np.sort(expected))
+        
+        summary = window.summary()
+        self.assertEqual(summary['sample_count'], len(expected))
+        self.assertAlmostEqual(summary['p50'], float(np.median(expected)))
+        self.assertAlmostEqual(summary['p95'], float(np.percentile(expected, 95)))
+        self.assertAlmostEqual(summary['p99'], float(np.percentile(expected, 99)))
+        self.assertAlmostEqual(summary['mean'], float(np.mean(expected)), places=9)
+        if len(expected) > 1:
+            self.assertAlmostEqual(summary['stddev'], float(np.std(expected, ddof=1)), places=9)
+    
+    def test_add_after_eviction(self):
+        window = SortedWindow(self.CAPACITY)
+        for i, value in enumerate(self.samples, 1):
+            window.add(float(value))
+            if i % 97 == 0 or i == len(self.samples):
+                self.assertMatchesNumpy(window, self.samples[:i])
+    
+    def test_add_many_after_eviction(self):
+        window = SortedWindow(self.CAPACITY)
+        seen = 0
+        for size in [30, 50, 45, 1, 0, 99, 7, 100, 160, 13] * 2:
+            window.add_many(self.samples[seen:seen + size])
+            seen += size
+            self.assertMatchesNumpy(window, self.samples[:seen])
+    
+    def test_from_samples(self):
+        window = SortedWindow.from_samples(self.CAPACITY, self.samples[:60])
+        window.add_many(self.samples[60:140])
+        self.assertMatchesNumpy(window, self.samples[:140])
+    
+    
+    def test_moments_stay_accurate_over_long_streams(self):
+        # Large offset, small spread: the case where rolling updates drift
+        samples = np.random.default_rng(9).normal(1e6, 1.0, 20000)
+        window = SortedWindow(self.CAPACITY)
+        for start in range(0, len(samples), 250):
+            for value in samples[start:start + 125]:
+                window.add(float(value))
+            window.add_many(samples[start + 125:start + 250])
+        
+        expected = samples[-self.CAPACITY:]
+        summary = window.summary()
+        self.assertAlmostEqual(summary['mean'], float(np.mean(expected)), places=6)
+        self.assertAlmostEqual(summary['stddev'], float(np.std(expected, ddof=1)), places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()